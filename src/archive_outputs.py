@@ -8,11 +8,16 @@ Or import and call from run.py:
     from src.archive_outputs import archive_existing_outputs
     archive_existing_outputs("funny-streamers")
 """
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from src.utils.log import log
 
+# Parallel tree copies when archives/ is on a different filesystem
+CROSS_DEVICE_WORKERS = 8
+
 
 def archive_existing_outputs(profile_slug: str) -> int:
     """
@@ -44,11 +49,15 @@ def archive_existing_outputs(profile_slug: str) -> int:
 
     archive_dir.mkdir(parents=True, exist_ok=True)
 
-    archived = 0
-    for pack_dir in packs:
-        dest = archive_dir / pack_dir.name
-        shutil.move(str(pack_dir), str(dest))
-        archived += 1
+    if os.stat(outputs_dir).st_dev == os.stat(archive_dir).st_dev:
+        # Same filesystem: each move is a single rename(2)
+        for pack_dir in packs:
+            os.rename(pack_dir, archive_dir / pack_dir.name)
+    else:
+        # Cross-device: shutil.move falls back to copy + delete — do packs in parallel
+        with ThreadPoolExecutor(max_workers=CROSS_DEVICE_WORKERS) as pool:
+            list(pool.map(lambda d: shutil.move(str(d), str(archive_dir / d.name)), packs))
+    archived = len(packs)
 
     log.info(f"📦 Archived {archived} output packs → {archive_dir}")
     return archived
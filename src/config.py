@@ -26,6 +26,37 @@ class Settings(BaseSettings):
     request_delay_sec: float = 1.5
     max_retries: int = 3
 
+    # Pipeline stage workers (run.py): clips in flight per stage at once
+    download_concurrency: int = 5
+    transcribe_concurrency: int = 0  # 0 = auto: 2 on CPU, 1 on whisper.cpp/Metal
+    decide_concurrency: int = 4      # LLM calls; mind the provider's rate limit
+
+    # faster-whisper model: a size name (distil-small.en, base.en, medium.en, ...),
+    # a Hugging Face repo id or a local CTranslate2 model dir
+    whisper_model: str = "distil-small.en"
+    # Transcription backend: auto | faster-whisper | whispercpp
+    # auto = whisper.cpp (Metal) on Apple Silicon when pywhispercpp is installed
+    whisper_backend: str = "auto"
+    whispercpp_model: str = "base.en-q5_1"   # ggml model, downloaded on first use
+    whisper_models_dir: str = "~/.cache/clipforge/whisper"  # ggml + converted int8 models
+    # whisper.cpp checkout used once to build the CoreML (ANE) encoder; needs a
+    # pywhispercpp built with WHISPER_COREML=1 and `pip install coremltools ane_transformers`
+    whispercpp_src: str = ""
+
+    # Rendering: parallel ffmpeg jobs x encoder threads each ≈ cores in use
+    render_concurrency: int = 2
+    ffmpeg_threads: int = 0          # 0 = cpu_count // render_concurrency
+    blur_background: bool = True     # False: letterbox non-vertical sources on black
+    hw_encoder: str = "auto"         # auto | h264_nvenc | h264_videotoolbox | h264_qsv | none
+    # libx264 speed/size trade-off, fastest → smallest: ultrafast, superfast, veryfast,
+    # faster, fast, medium, slow, slower, veryslow, placebo. Platforms re-encode
+    # uploads anyway, so "faster" at crf 23 is visually the same as "medium".
+    x264_preset: str = "faster"
+    # Stream-copy AAC source audio when there are no bleeps/music (skips loudnorm)
+    audio_passthrough: bool = False
+    # Fragmented MP4 output: no +faststart rewrite pass, less player compatibility
+    fragmented_mp4: bool = False
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
     @property
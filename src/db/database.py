@@ -1,5 +1,6 @@
 """SQLite DB setup + schema. Upgrade notes for Postgres inline."""
 import sqlite3
+import threading
 from pathlib import Path
 from src.config import settings
 
@@ -67,6 +68,9 @@ CREATE INDEX IF NOT EXISTS idx_clips_profile ON clips(profile_id, status);
 # Migration: add viral_score column to existing DBs
 MIGRATIONS = [
     "ALTER TABLE clips ADD COLUMN viral_score INTEGER",
+    # Top-N selection (run.select_top_clips) walks this in order instead of sorting
+    """CREATE INDEX IF NOT EXISTS idx_clips_status_score
+       ON clips(profile_id, status, viral_score DESC, updated_at ASC)""",
 ]
 
 
@@ -76,13 +80,63 @@ def get_db(db_path: str | None = None) -> sqlite3.Connection:
     conn = sqlite3.connect(path)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
+    # WAL stays consistent with NORMAL; only the last commits can be lost on power failure
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # 64 MB page cache, temp B-trees (sorts, GROUP BY) in RAM
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA temp_store=MEMORY")
     conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
 
+_local = threading.local()
+
+
+def shared_db(db_path: str | None = None) -> sqlite3.Connection:
+    """
+    Long-lived connection for the calling thread, opened (and PRAGMAs set)
+    on first use. Do NOT close it — it is reused by every later caller on
+    the same thread. Use `with db:` to commit.
+    """
+    path = db_path or settings.database_path
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(path)
+    if conn is None:
+        conn = conns[path] = get_db(path)
+    return conn
+
+
+def pipeline_counts(db: sqlite3.Connection, profile_slug: str) -> dict[str, int]:
+    """{status: clip count} for a profile, in one grouped scan of idx_clips_profile."""
+    rows = db.execute("""
+        SELECT cl.status, COUNT(*) as cnt
+        FROM clips cl
+        JOIN profiles p ON p.id = cl.profile_id
+        WHERE p.slug = ?
+        GROUP BY cl.status ORDER BY cl.status
+    """, (profile_slug,))
+    return {r["status"]: r["cnt"] for r in rows}
+
+
+# Bump whenever SCHEMA or MIGRATIONS change; stored in PRAGMA user_version
+SCHEMA_VERSION = 1
+
+# DB paths already checked/migrated by this process
+_schema_ready: set[str] = set()
+
+
 def init_db(db_path: str | None = None) -> sqlite3.Connection:
     """Create tables if they don't exist, then run migrations."""
-    conn = get_db(db_path)
+    path = db_path or settings.database_path
+    conn = get_db(path)
+    if path in _schema_ready:
+        return conn
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        _schema_ready.add(path)
+        return conn
+
     conn.executescript(SCHEMA)
     conn.commit()
 
@@ -94,4 +148,7 @@ def init_db(db_path: str | None = None) -> sqlite3.Connection:
         except sqlite3.OperationalError:
             pass  # Column already exists
 
-    return conn
\ No newline at end of file
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+    _schema_ready.add(path)
+    return conn
@@ -269,7 +269,7 @@ async def decide_clip(clip_row_id: int) -> bool:
         db.close()
         return False
 
-    with open(transcript_path) as f:
+    with open(transcript_path, encoding="utf-8") as f:
         transcript = json.load(f)
 
     log.info(f"Deciding: {clip_meta.title} ({row['platform']}/{row['clip_id'][:30]}...)")
@@ -9,6 +9,7 @@ Used by:
   - decider.py (pre-filter before LLM call)
   - renderer.py (word-level bleep map for audio/captions)
 """
+import functools
 import re
 from src.utils.log import log
 
@@ -125,9 +126,19 @@ def content_pre_filter(full_text: str) -> tuple[bool, str]:
     return True, ""
 
 
+_NON_ALPHA = re.compile(r"[^a-z]")
+
+
+# Memoized: captions and transcripts repeat the same words constantly
+@functools.lru_cache(maxsize=4096)
 def _clean_word(word: str) -> str:
     """Strip punctuation for matching."""
-    return re.sub(r'[^a-z]', '', word.lower())
+    return _NON_ALPHA.sub("", word.lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def _censor_word(word: str) -> str:
+    return "[BLEEP]" if _clean_word(word) in BLEEP_WORDS else word
 
 
 def get_bleep_map(transcript: dict, segment_start: float = 0, segment_end: float = 999) -> list[dict]:
@@ -172,11 +183,4 @@ def censor_caption_text(text: str) -> str:
     Replace bleep-worthy words in a caption string with [BLEEP].
     Used for caption display text.
     """
-    words = text.split()
-    result = []
-    for w in words:
-        if _clean_word(w) in BLEEP_WORDS:
-            result.append("[BLEEP]")
-        else:
-            result.append(w)
-    return " ".join(result)
\ No newline at end of file
+    return " ".join(map(_censor_word, text.split()))
\ No newline at end of file
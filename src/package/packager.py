@@ -19,14 +19,19 @@ from src.utils.log import log
 
 
 async def extract_thumbnail(video_path: str, output_path: str, timestamp: float = 1.0) -> bool:
+    # Any frame near `timestamp` will do — grab the keyframe instead of decoding up to it
     cmd = [
-        "ffmpeg", "-y", "-ss", str(timestamp),
+        "ffmpeg", "-y", "-noaccurate_seek", "-ss", str(timestamp),
         "-i", video_path, "-vframes", "1", "-q:v", "2", output_path,
     ]
+    # Output is never read — no pipes to drain, just wait for the exit code
     proc = await asyncio.create_subprocess_exec(
-        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
     )
-    await proc.communicate()
+    await proc.wait()
     return proc.returncode == 0 and Path(output_path).exists()
 
 
@@ -82,8 +82,18 @@ def diarize_speakers(
         return []
 
     try:
+        # Reuse the samples the transcriber already decoded instead of having
+        # pyannote decode the video again
+        from src.transcribe.transcriber import SAMPLE_RATE, cached_pcm
+        pcm = cached_pcm(audio_path)
+        if pcm is not None:
+            import torch
+            audio = {"waveform": torch.from_numpy(pcm).unsqueeze(0), "sample_rate": SAMPLE_RATE}
+        else:
+            audio = audio_path
+
         diarization = pipeline(
-            audio_path,
+            audio,
             min_speakers=min_speakers,
             max_speakers=max_speakers,
         )
@@ -122,16 +132,20 @@ def assign_speakers_to_words(
     Takes Whisper word timestamps and pyannote speaker segments,
     returns words with an added "speaker" field.
 
+    The input words are never mutated: labelled words are new dicts, words
+    outside the segment are passed through as-is, and the returned list keeps
+    the input's length and order.
+
     Words that don't fall within any diarization segment get "SPEAKER_00" (default).
     """
     if not diarization_segments:
         # No diarization data — all words get default speaker
-        for w in words:
-            w["speaker"] = "SPEAKER_00"
-        return words
+        return [w | {"speaker": "SPEAKER_00"} for w in words]
 
+    labelled = []
     for w in words:
         if w["end"] <= segment_start or w["start"] >= segment_end:
+            labelled.append(w)
             continue
 
         word_mid = (w["start"] + w["end"]) / 2
@@ -152,6 +166,6 @@ def assign_speakers_to_words(
             if best_overlap == 0 and seg["start"] <= word_mid <= seg["end"]:
                 best_speaker = seg["speaker"]
 
-        w["speaker"] = best_speaker
+        labelled.append(w | {"speaker": best_speaker})
 
-    return words
\ No newline at end of file
+    return labelled
\ No newline at end of file
@@ -9,18 +9,47 @@ Changes from v7:
   - Graceful fallback: if diarization unavailable, all captions use yellow
 """
 import asyncio
+import bisect
+import functools
 import json
+import os
 import re
+import sqlite3
+import tempfile
 import textwrap
 from pathlib import Path
-from src.db.database import get_db
+from src.db.database import shared_db
 from src.models.schemas import ClipMeta, ClipStatus, EditDecision, Segment
 from src.config import settings
 from src.utils.log import log
-from src.moderation.content_mod import get_bleep_map, BLEEP_WORDS
+from src.moderation.content_mod import get_bleep_map, censor_caption_text
+
+# Optional render extras — bound once here rather than imported per clip
+try:
+    from src.render.diarize import diarize_speakers, assign_speakers_to_words
+    _HAS_DIARIZE = True
+except ImportError:
+    _HAS_DIARIZE = False
+
+try:
+    from src.render.music_mixer import get_music_track
+    _HAS_MUSIC = True
+except ImportError:
+    _HAS_MUSIC = False
+
+try:
+    import orjson  # faster parse for big word-level transcripts
+except ImportError:
+    orjson = None
+
+try:
+    import av  # PyAV: read container headers in-process instead of forking ffprobe
+except ImportError:
+    av = None
 
 from pathlib import Path as _Path
 
+@functools.cache
 def _get_font() -> str:
     """Find Impact font with Linux/Docker fallback."""
     for candidate in [
@@ -34,16 +63,26 @@ def _get_font() -> str:
 
 FONT_PATH = _get_font()
 
+# Family name + bold flag libass needs to pick FONT_PATH out of its directory
+_FONT_FAMILIES = {
+    "Impact.ttf": ("Impact", 0),
+    "DejaVuSans-Bold.ttf": ("DejaVu Sans", -1),
+}
+FONT_NAME, FONT_BOLD = _FONT_FAMILIES.get(_Path(FONT_PATH).name, ("Impact", 0))
+
 
 # ── Speaker color palette ─────────────────────────────────────────────────────
-# ffmpeg drawtext fontcolor values
+# #RRGGBB caption colors (converted to ASS &HBBGGRR& when written)
 SPEAKER_COLORS = [
-    "yellow",       # SPEAKER_00 (default / primary speaker)
-    "cyan",         # SPEAKER_01
+    "#FFFF00",      # SPEAKER_00 (yellow — default / primary speaker)
+    "#00FFFF",      # SPEAKER_01 (cyan)
     "#FF69B4",      # SPEAKER_02 (pink)
     "#00FF7F",      # SPEAKER_03 (green)
 ]
 
+# Per-word helpers below are memoized: captions repeat the same words and
+# speaker labels constantly. Caches are process-local and bounded.
+@functools.lru_cache(maxsize=4096)
 def _speaker_color(speaker_id: str) -> str:
     """Map speaker label to color. Defaults to yellow."""
     try:
@@ -53,76 +92,185 @@ def _speaker_color(speaker_id: str) -> str:
         return SPEAKER_COLORS[0]
 
 
-def _clean_word(word: str) -> str:
-    return re.sub(r'[^a-z]', '', word.lower())
+# (path, mtime_ns, size) -> probe result; a changed file gets a new key
+_probe_cache: dict[tuple[str, int, int], dict] = {}
 
 
 async def probe_video(source_path: str) -> dict:
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return {}
+    key = (source_path, st.st_mtime_ns, st.st_size)
+    cached = _probe_cache.get(key)
+    if cached is not None:
+        return cached
+
+    probe = {}
+    if av is not None:
+        probe = await asyncio.to_thread(_pyav_probe, source_path)
+    if not probe:
+        probe = await _ffprobe(source_path)
+    if probe:
+        _probe_cache[key] = probe
+    return probe
+
+
+def _pyav_probe(source_path: str) -> dict:
+    """Same fields as _ffprobe, read via libavformat. {} on any failure."""
+    try:
+        with av.open(source_path, metadata_errors="ignore") as container:
+            if not container.streams.video:
+                return {}
+            video = container.streams.video[0]
+            if video.duration is not None and video.time_base is not None:
+                duration = float(video.duration * video.time_base)
+            else:
+                duration = (container.duration or 0) / av.time_base
+            info = {
+                "width": video.codec_context.width,
+                "height": video.codec_context.height,
+                "codec": video.codec_context.name,
+                "duration": duration,
+            }
+            if container.streams.audio:
+                audio = container.streams.audio[0]
+                info["audio_codec"] = audio.codec_context.name
+                info["sample_rate"] = audio.codec_context.sample_rate
+            return info
+    except Exception:
+        return {}
+
+
+async def _ffprobe(source_path: str) -> dict:
+    # Only the fields we use, one "key=value|key=value" line per stream —
+    # a few hundred bytes instead of the full -show_streams JSON dump
     proc = await asyncio.create_subprocess_exec(
-        "ffprobe", "-v", "quiet", "-print_format", "json", "-show_streams",
-        source_path, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        "ffprobe", "-v", "quiet",
+        "-show_entries", "stream=codec_type,codec_name,width,height,duration,sample_rate",
+        "-of", "compact=p=0",
+        source_path, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
     )
     stdout, _ = await proc.communicate()
     if proc.returncode != 0:
         return {}
-    data = json.loads(stdout)
-    for stream in data.get("streams", []):
-        if stream.get("codec_type") == "video":
-            return {
-                "width": int(stream.get("width", 0)),
-                "height": int(stream.get("height", 0)),
-                "codec": stream.get("codec_name", ""),
-                "duration": float(stream.get("duration", 0)),
-            }
-    return {}
+
+    streams = [
+        dict(kv.split("=", 1) for kv in line.split("|") if "=" in kv)
+        for line in stdout.decode(errors="replace").splitlines() if line
+    ]
+    video = next((st for st in streams if st.get("codec_type") == "video"), None)
+    if video is None:
+        return {}
+    info = {
+        "width": _to_int(video.get("width")),
+        "height": _to_int(video.get("height")),
+        "codec": video.get("codec_name", ""),
+        "duration": _to_float(video.get("duration")),
+    }
+    audio = next((st for st in streams if st.get("codec_type") == "audio"), None)
+    if audio is not None:
+        info["audio_codec"] = audio.get("codec_name", "")
+        info["sample_rate"] = _to_int(audio.get("sample_rate"))
+    return info
+
+
+def _to_int(value: str | None) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_float(value: str | None) -> float:
+    # ffprobe prints "N/A" for unknown durations
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Plain letterbox into 1080x1920 — used for vertical sources and the fallbacks
+PAD_LAYOUT = "scale=1080:1920:force_original_aspect_ratio=decrease,pad=1080:1920:(ow-iw)/2:(oh-ih)/2"
+
+# Sources at least this tall relative to 9:16 fill the frame without a blurred backdrop
+VERTICAL_RATIO = 16 / 9 * 0.95
 
 
 def _build_video_filter(src_w: int, src_h: int) -> str:
     if src_w <= 0 or src_h <= 0:
         src_w, src_h = 1920, 1080
 
+    # Exactly the output size: scale+pad would be a no-op full-frame pass
+    if (src_w, src_h) == (1080, 1920):
+        return "[0:v]null"
+
+    # Already vertical (nothing to fill) or blur turned off: skip the split/blur/overlay pass
+    if not settings.blur_background or src_h / src_w >= VERTICAL_RATIO:
+        return "[0:v]" + PAD_LAYOUT
+
     vf = (
         "[0:v]split[bg][fg];"
-        "[bg]scale=1080:1920:force_original_aspect_ratio=increase,"
-        "crop=1080:1920,"
-        "boxblur=20:5[blurred];"
+        # Blur at quarter resolution and upscale — 16x fewer pixels. gblur's
+        # cost doesn't grow with sigma; 6 here ≈ the old full-res boxblur=20:5
+        "[bg]scale=270:480:force_original_aspect_ratio=increase,"
+        "crop=270:480,"
+        "gblur=sigma=6,"
+        "scale=1080:1920:flags=bilinear[blurred];"
         "[fg]scale=1080:-2[sharp];"
         "[blurred][sharp]overlay=(W-w)/2:(H-h)/2"
     )
     return vf
 
 
+# One-pass escape tables (str.translate) instead of chained str.replace calls
+_DRAWTEXT_TRANS = str.maketrans({
+    "\\": "\\\\\\\\",
+    "'": "\u2019",
+    ":": "\\:",
+    "%": "%%",
+    '"': '\\"',
+})
+
+
+@functools.lru_cache(maxsize=4096)
 def _escape_drawtext(text: str) -> str:
-    escaped = text
-    escaped = escaped.replace("\\", "\\\\\\\\")
-    escaped = escaped.replace("'", "\u2019")
-    escaped = escaped.replace(":", "\\:")
-    escaped = escaped.replace("%", "%%")
-    escaped = escaped.replace('"', '\\"')
-    return escaped
+    return text.translate(_DRAWTEXT_TRANS)
 
 
-def _censor_word(word: str) -> str:
-    """Replace profanity with [BLEEP] for caption display."""
-    if _clean_word(word) in BLEEP_WORDS:
-        return "[BLEEP]"
-    return word
+def _segment_words(transcript: dict, words: list[dict], segment: Segment) -> list[dict]:
+    """
+    Words overlapping the segment, found by bisecting word start times instead
+    of scanning the whole transcript. `words` is transcript["words"] or a
+    same-order speaker-annotated copy of it. Start times (plus the longest word
+    duration, which bounds how far back an overlapping word can start) are
+    cached on the transcript dict under "_word_starts".
+    """
+    cached = transcript.get("_word_starts")
+    if cached is None or len(cached[0]) != len(words):
+        starts = [w["start"] for w in words]
+        max_dur = max((w["end"] - w["start"] for w in words), default=0.0)
+        cached = transcript["_word_starts"] = (starts, max_dur)
+    starts, max_dur = cached
 
+    lo = bisect.bisect_left(starts, segment.start - max_dur)
+    hi = bisect.bisect_left(starts, segment.end)
+    return [w for w in words[lo:hi] if w["end"] > segment.start]
 
-def _build_caption_filters(
+
+def _caption_chunks(
     transcript: dict,
     segment: Segment,
     max_words: int = 2,
     speaker_words: list[dict] | None = None,
-) -> str:
+) -> list[tuple[str, float, float, str]]:
     """
-    Build caption filters with:
-      - Configurable words-per-chunk (default 2)
-      - Per-speaker colors when diarization is available
-      - Profanity replaced by [BLEEP]
+    Split the segment's speech into caption chunks.
+
+    Returns [(TEXT, start, end, color), ...] with times relative to the
+    segment start, text censored + uppercased (unescaped).
     """
-    filters = []
-    FONT = FONT_PATH
+    chunks = []
     TAIL_PAD = 0.15
 
     has_word_timestamps = bool(transcript.get("words"))
@@ -130,10 +278,7 @@ def _build_caption_filters(
     if has_word_timestamps:
         # Use speaker-annotated words if available, else plain transcript words
         words = speaker_words if speaker_words else transcript["words"]
-        seg_words = [
-            w for w in words
-            if w["end"] > segment.start and w["start"] < segment.end
-        ]
+        seg_words = _segment_words(transcript, words, segment)
 
         for i in range(0, len(seg_words), max_words):
             chunk_words = seg_words[i:i + max_words]
@@ -156,20 +301,8 @@ def _build_caption_filters(
             color = _speaker_color(speaker)
 
             # Censor profanity in caption text
-            chunk_text = " ".join(_censor_word(w["word"]) for w in chunk_words)
-            escaped = _escape_drawtext(chunk_text.upper())
-
-            filters.append(
-                f"drawtext=text='{escaped}'"
-                f":fontsize=80"
-                f":fontcolor={color}"
-                f":fontfile={FONT}"
-                f":borderw=4"
-                f":bordercolor=black"
-                f":x=(w-text_w)/2"
-                f":y=h*0.78"
-                f":enable='between(t\\,{c_start:.3f}\\,{c_end:.3f})'"
-            )
+            chunk_text = censor_caption_text(" ".join(w["word"].strip() for w in chunk_words))
+            chunks.append((chunk_text.upper(), c_start, c_end, color))
     else:
         # Fallback: no word timestamps — use segment-level timing, default yellow
         for seg in transcript.get("segments", []):
@@ -188,69 +321,189 @@ def _build_caption_filters(
             if not text:
                 continue
 
-            words = text.split()
-            if not words:
+            censored_words = censor_caption_text(text).upper().split()
+            if not censored_words:
                 continue
 
-            censored_words = [_censor_word(w) for w in words]
+            # Even split of the segment's time across ceil(words / max_words) chunks
+            n_chunks = -(-len(censored_words) // max_words)
+            chunk_duration = (rel_end - rel_start) / n_chunks
+
+            for ci in range(n_chunks):
+                chunks.append((
+                    " ".join(censored_words[ci * max_words:(ci + 1) * max_words]),
+                    rel_start + ci * chunk_duration,
+                    rel_start + (ci + 1) * chunk_duration,
+                    SPEAKER_COLORS[0],
+                ))
+
+    return chunks
+
 
-            chunks = []
-            for ci in range(0, len(censored_words), max_words):
-                chunks.append(" ".join(censored_words[ci:ci + max_words]))
+# Max silence between two identical chunks that still reads as one caption
+REPEAT_MERGE_GAP = 0.3
 
-            if not chunks:
+
+def _merge_repeated_chunks(
+    chunks: list[tuple[str, float, float, str]],
+) -> list[tuple[str, float, float, str]]:
+    """Fold back-to-back chunks with the same text and color into one longer chunk."""
+    merged = []
+    for text, c_start, c_end, color in chunks:
+        if merged:
+            p_text, p_start, p_end, p_color = merged[-1]
+            if (text, color) == (p_text, p_color) and c_start - p_end <= REPEAT_MERGE_GAP:
+                merged[-1] = (p_text, p_start, max(p_end, c_end), p_color)
                 continue
+        merged.append((text, c_start, c_end, color))
+    return merged
+
+
+def _ass_color(color: str) -> str:
+    """#RRGGBB -> ASS &HBBGGRR& (ASS stores colors blue-first)."""
+    rgb = color.lstrip("#")
+    return f"&H{rgb[4:6]}{rgb[2:4]}{rgb[0:2]}&"
+
+
+def _ass_time(t: float) -> str:
+    """Seconds -> ASS H:MM:SS.cc timestamp."""
+    cs = int(round(max(t, 0.0) * 100))
+    return f"{cs // 360000}:{cs // 6000 % 60:02d}:{cs // 100 % 60:02d}.{cs % 100:02d}"
+
+
+_ASS_TRANS = str.maketrans({"\\": "/", "{": "(", "}": ")"})
 
-            chunk_duration = (rel_end - rel_start) / len(chunks)
 
-            for ci, chunk in enumerate(chunks):
-                c_start = rel_start + ci * chunk_duration
-                c_end = rel_start + (ci + 1) * chunk_duration
-                escaped = _escape_drawtext(chunk.upper())
+def _escape_ass_text(text: str) -> str:
+    """Keep caption text from being read as ASS override blocks or escapes."""
+    return text.translate(_ASS_TRANS)
 
-                filters.append(
-                    f"drawtext=text='{escaped}'"
-                    f":fontsize=80"
-                    f":fontcolor=yellow"
-                    f":fontfile={FONT}"
-                    f":borderw=4"
-                    f":bordercolor=black"
-                    f":x=(w-text_w)/2"
-                    f":y=h*0.78"
-                    f":enable='between(t\\,{c_start:.3f}\\,{c_end:.3f})'"
-                )
 
-    return ",".join(filters) if filters else ""
+# Caption style: 1080x1920 canvas, top-centre aligned at y = 78% (matches the old drawtext y=h*0.78)
+_ASS_HEADER = (
+    "[Script Info]\n"
+    "ScriptType: v4.00+\n"
+    "PlayResX: 1080\n"
+    "PlayResY: 1920\n"
+    "WrapStyle: 2\n"
+    "ScaledBorderAndShadow: yes\n"
+    "\n"
+    "[V4+ Styles]\n"
+    "Format: Name, Fontname, Fontsize, PrimaryColour, OutlineColour, BackColour, Bold, "
+    "BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV\n"
+    f"Style: Caption,{FONT_NAME},80,&H00{_ass_color(SPEAKER_COLORS[0])[2:-1]},&H00000000,&H00000000,{FONT_BOLD},"
+    "1,4,0,8,0,0,1498\n"
+    "\n"
+    "[Events]\n"
+    "Format: Layer, Start, End, Style, Text\n"
+)
+
+_ASS_DIALOGUE_TMPL = "Dialogue: 0,{s},{e},Caption,{{\\c{c}}}{t}\n"
+
+
+def _build_ass_subtitles(chunks: list[tuple[str, float, float, str]], path: Path) -> Path:
+    """Write caption chunks as one ASS script with per-chunk speaker colors."""
+    lines = [_ASS_HEADER]
+    lines.extend(
+        _ASS_DIALOGUE_TMPL.format(
+            s=_ass_time(c_start), e=_ass_time(c_end),
+            c=_ass_color(color), t=_escape_ass_text(text),
+        )
+        for text, c_start, c_end, color in chunks
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(lines), encoding="utf-8")
+    return path
+
+
+def _build_caption_filters(
+    transcript: dict,
+    segment: Segment,
+    caption_dir: Path,
+    max_words: int = 2,
+    speaker_words: list[dict] | None = None,
+) -> str:
+    """
+    Build the caption chain as ONE ass (libass) filter over an .ass
+    script, instead of drawtext nodes evaluated on every frame.
+
+      - Configurable words-per-chunk (default 2)
+      - Per-speaker colors when diarization is available
+      - Profanity replaced by [BLEEP]
+
+    Writes caption_dir/captions.ass and returns the filter ("" if no captions).
+    """
+    chunks = _merge_repeated_chunks(_caption_chunks(transcript, segment, max_words, speaker_words))
+    if not chunks:
+        return ""
+
+    ass_path = _build_ass_subtitles(chunks, caption_dir / "captions.ass")
+    fonts_dir = _Path(FONT_PATH).parent
+    # ass= hands the script straight to libass (subtitles= would go through a decoder first)
+    return f"ass=filename='{ass_path.as_posix()}':fontsdir='{fonts_dir.as_posix()}'"
+
+
+LOUDNORM_FILTER = "loudnorm=I=-14:TP=-1:LRA=11"
+
+# [0:a] speech chain ducked under [1:a] music, faded in/out over the segment
+MUSIC_MIX_TEMPLATE = (
+    "[0:a]{speech}[speech];"
+    "[1:a]atrim=0:{duration:.1f},"
+    "afade=t=in:st=0:d=1.0,"
+    "afade=t=out:st={fade_start:.1f}:d=2.0,"
+    "volume=0.10[music];"
+    "[speech][music]amix=inputs=2:duration=first:dropout_transition=2[aout]"
+)
+
+
+# Mute / unmute one named volume node at each bleep interval's edges
+_BLEEP_CMD_TMPL = "{s:.3f}-{e:.3f} [enter] volume@bleep volume 0, [leave] volume@bleep volume 1;\n"
 
 
 def _build_bleep_audio_filter(
     bleep_map: list[dict],
     segment_start: float,
+    cmd_dir: Path,
 ) -> str:
-    """Build ffmpeg volume filter that mutes audio at bleep timestamps."""
+    """
+    Build the audio filters that mute speech at bleep timestamps.
+
+    Padded bleep intervals are merged when they overlap, then written to
+    cmd_dir/bleeps.cmd for asendcmd to toggle a single volume node — the
+    per-frame cost stays constant however many bleeps the clip has, unlike
+    a between()+between()+... enable expression.
+    """
     if not bleep_map:
         return ""
 
-    conditions = []
-    for b in bleep_map:
-        rel_start = b["start"] - segment_start
-        rel_end = b["end"] - segment_start
-        rel_start = max(0, rel_start - 0.05)
-        rel_end = rel_end + 0.05
-        conditions.append(f"between(t\\,{rel_start:.3f}\\,{rel_end:.3f})")
+    intervals = sorted(
+        (max(0, b["start"] - segment_start - 0.05), b["end"] - segment_start + 0.05)
+        for b in bleep_map
+    )
+
+    merged = [intervals[0]]
+    for start, end in intervals[1:]:
+        cur_start, cur_end = merged[-1]
+        if start <= cur_end:
+            merged[-1] = (cur_start, max(cur_end, end))
+        else:
+            merged.append((start, end))
 
-    enable_expr = "+".join(conditions)
-    return f"volume=0:enable='{enable_expr}'"
+    cmd_file = cmd_dir / "bleeps.cmd"
+    cmd_file.write_text("".join(_BLEEP_CMD_TMPL.format(s=s, e=e) for s, e in merged))
+    return f"asendcmd=f='{cmd_file.as_posix()}',volume@bleep=volume=1"
+
+
+_EMOJI_RE = re.compile(
+    r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF'
+    r'\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251'
+    r'\U0001f900-\U0001f9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF'
+    r'\U00002600-\U000026FF\U0000FE0F\U0000200D]+'
+)
 
 
 def _strip_emojis(text: str) -> str:
-    return re.sub(
-        r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF'
-        r'\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251'
-        r'\U0001f900-\U0001f9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF'
-        r'\U00002600-\U000026FF\U0000FE0F\U0000200D]+',
-        '', text
-    ).strip()
+    return _EMOJI_RE.sub('', text).strip()
 
 
 def _get_title(ed: EditDecision, clip_meta: ClipMeta) -> str:
@@ -264,48 +517,392 @@ def _get_title(ed: EditDecision, clip_meta: ClipMeta) -> str:
     return ""
 
 
-def _build_title_filters(title: str, duration: float) -> str:
-    if not title:
-        return ""
+TITLE_FONTSIZE = 72
+TITLE_LINE_HEIGHT = 90
+TITLE_BASE_Y = 100
+TITLE_BOX_PAD = 12
 
+
+def _title_lines(title: str) -> list[str]:
+    """Emoji-stripped title wrapped to at most 3 lines of 25 chars."""
+    if not title:
+        return []
     title = _strip_emojis(title.strip())
     if not title:
-        return ""
-    lines = textwrap.wrap(title, width=25)
+        return []
+    return textwrap.wrap(title, width=25)[:3]
+
+
+def _render_title_png(title_lines: list[str], out_png: Path) -> Path | None:
+    """
+    Rasterize the title block once into a transparent 1080x1920 PNG so ffmpeg
+    can overlay it instead of running drawtext on every frame.
+
+    Returns None when Pillow isn't installed (caller falls back to drawtext).
+    """
+    if not title_lines:
+        return None
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        return None
+
+    try:
+        font = ImageFont.truetype(FONT_PATH, TITLE_FONTSIZE)
+        img = Image.new("RGBA", (1080, 1920), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        for i, line in enumerate(title_lines):
+            text = line.upper()
+            y_pos = TITLE_BASE_Y + i * TITLE_LINE_HEIGHT
+            left, top, right, bottom = draw.textbbox((0, y_pos), text, font=font)
+            x_pos = (1080 - (right - left)) / 2
+            draw.rectangle(
+                (x_pos - TITLE_BOX_PAD, top - TITLE_BOX_PAD,
+                 x_pos + (right - left) + TITLE_BOX_PAD, bottom + TITLE_BOX_PAD),
+                fill=(0, 0, 0, 140),  # black@0.55
+            )
+            draw.text(
+                (x_pos, y_pos), text, font=font, fill="white",
+                stroke_width=4, stroke_fill="black",
+            )
+        img.save(out_png)
+        return out_png
+    except Exception as e:
+        log.warning(f"  Title PNG render failed: {e} → drawtext title")
+        return None
+
+
+# One drawtext per title line (fallback when the title PNG can't be rasterized).
+# Constant fields are baked in at import; only text/y/duration vary per line.
+_TITLE_DRAWTEXT_TMPL = (
+    "drawtext=text='{t}'"
+    f":fontsize={TITLE_FONTSIZE}"
+    ":fontcolor=white"
+    f":fontfile={FONT_PATH}"
+    ":borderw=4"
+    ":bordercolor=black"
+    ":x=(w-text_w)/2"
+    ":y={y}"
+    ":box=1"
+    ":boxcolor=black@0.55"
+    f":boxborderw={TITLE_BOX_PAD}"
+    ":enable='between(t\\,0.0\\,{d:.1f})'"
+)
+
+
+def _build_title_filters(title: str, duration: float) -> str:
+    lines = _title_lines(title)
     if not lines:
         return ""
-    lines = lines[:3]
-
-    filters = []
-    FONT = FONT_PATH
-    FONTSIZE = 72
-    line_height = 90
-    base_y = 100
-
-    for i, line in enumerate(lines):
-        escaped = _escape_drawtext(line.upper())
-        y_pos = base_y + i * line_height
-
-        filters.append(
-            f"drawtext=text='{escaped}'"
-            f":fontsize={FONTSIZE}"
-            f":fontcolor=white"
-            f":fontfile={FONT}"
-            f":borderw=4"
-            f":bordercolor=black"
-            f":x=(w-text_w)/2"
-            f":y={y_pos}"
-            f":box=1"
-            f":boxcolor=black@0.55"
-            f":boxborderw=12"
-            f":enable='between(t\\,0.0\\,{duration:.1f})'"
+
+    return ",".join(
+        _TITLE_DRAWTEXT_TMPL.format(
+            t=_escape_drawtext(line.upper()),
+            y=TITLE_BASE_Y + i * TITLE_LINE_HEIGHT,
+            d=duration,
         )
+        for i, line in enumerate(lines)
+    )
 
-    return ",".join(filters) if filters else ""
 
+# macOS/Linux: hand filter scripts to ffmpeg through /dev/stdin instead of a
+# file on disk. Windows has no /dev/stdin, so it keeps the temp-file path.
+PIPE_FILTER_SCRIPTS = os.name != "nt"
 
-async def render_clip(clip_row_id: int) -> bool:
-    db = get_db()
+# Per-render scratch files (captions.ass, title.png, Windows filter scripts)
+# live in RAM-backed /dev/shm where available, else the system temp dir
+SCRATCH_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+# Graphs up to this size go straight on argv — well under Windows' 32K command line
+INLINE_FILTER_MAX = 8192
+
+_SCRIPT_OPTION = {"-filter_complex": "-filter_complex_script", "-filter:v": "-filter_script:v"}
+
+
+async def _filter_graph_args(option: str, script: str, fallback_path: Path) -> tuple[list[str], bytes | None]:
+    """Return (ffmpeg args carrying the filter graph, bytes to feed its stdin)."""
+    if len(script) <= INLINE_FILTER_MAX:
+        return [option, script], None
+    if PIPE_FILTER_SCRIPTS:
+        return [_SCRIPT_OPTION[option], "/dev/stdin"], script.encode()
+    await asyncio.to_thread(fallback_path.write_text, script)
+    return [_SCRIPT_OPTION[option], str(fallback_path)], None
+
+
+# Only the end of ffmpeg's stderr is ever logged — keep just that much
+STDERR_TAIL = 2048
+
+
+async def _run_ffmpeg(cmd: list[str], stdin_data: bytes | None = None) -> tuple[int, bytes]:
+    """
+    Run ffmpeg, optionally piping `stdin_data` in.
+    Returns (returncode, last STDERR_TAIL bytes of stderr).
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if stdin_data is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    async def feed() -> None:
+        if stdin_data is None:
+            return
+        try:
+            proc.stdin.write(stdin_data)
+            await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # ffmpeg exited early; its stderr says why
+        finally:
+            proc.stdin.close()
+
+    async def drain_tail() -> bytes:
+        tail = b""
+        while chunk := await proc.stderr.read(1 << 16):
+            tail = (tail + chunk)[-STDERR_TAIL:]
+        return tail
+
+    _, stderr = await asyncio.gather(feed(), drain_tail())
+    await proc.wait()
+    return proc.returncode, stderr
+
+
+def _diarized_words(source_path: str, transcript: dict, segment: Segment) -> list[dict] | None:
+    """
+    Speaker-labelled copy of the transcript words, or None when diarization
+    is unavailable or fails. Blocking — run it off the event loop.
+    """
+    if not _HAS_DIARIZE:
+        log.info("  Speaker diarization not available (pyannote not installed) → yellow captions")
+        return None
+    try:
+        diarization_segments = diarize_speakers(
+            source_path,
+            segment_start=segment.start,
+            segment_end=segment.end,
+            min_speakers=1,
+            max_speakers=4,
+        )
+        if not diarization_segments:
+            return None
+
+        # Returns new word dicts — the transcript itself is left untouched
+        speaker_words = assign_speakers_to_words(
+            transcript.get("words", []),
+            diarization_segments,
+            segment_start=segment.start,
+            segment_end=segment.end,
+        )
+        unique = set(w.get("speaker", "SPEAKER_00") for w in speaker_words)
+        if len(unique) > 1:
+            log.info(f"  🎨 Speaker colors: {len(unique)} speakers → multi-color captions")
+        else:
+            log.info(f"  🎨 Single speaker → yellow captions")
+        return speaker_words
+    except ImportError:
+        log.info("  Speaker diarization not available (pyannote not installed) → yellow captions")
+    except Exception as e:
+        log.warning(f"  Speaker diarization failed: {e} → yellow captions")
+    return None
+
+
+def _pick_music_track() -> str | None:
+    if not _HAS_MUSIC:
+        return None
+    return get_music_track(mood="funny")
+
+
+# Hardware H.264 encoders, best first, at roughly libx264 crf 23 quality
+_HW_ENCODER_ARGS = {
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "23", "-b:v", "0"],
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-q:v", "60"],
+    "h264_qsv": ["-c:v", "h264_qsv", "-preset", "medium", "-global_quality", "23"],
+}
+
+# Decoder to pair with each GPU encoder. Frames still come back to system memory:
+# the blur graph (gblur/split) and libass have no GPU equivalents, so keeping
+# frames device-resident would mean a hwdownload/hwupload round trip anyway.
+_HW_DECODE_ARGS = {
+    "h264_nvenc": ["-hwaccel", "cuda"],
+    "h264_videotoolbox": ["-hwaccel", "videotoolbox"],
+}
+
+# (encoder name, args) once resolved
+_video_encoder_choice: tuple[str, list[str]] | None = None
+_video_encoder_lock = asyncio.Lock()
+
+
+def _movflags() -> str:
+    """
+    +faststart rewrites the whole file after encoding to move the moov atom up
+    front; fragmented MP4 writes it first and skips that pass, at the cost of
+    compatibility with some older players/uploaders (so it's opt-in).
+    """
+    if settings.fragmented_mp4:
+        return "+frag_keyframe+empty_moov+default_base_moof"
+    return "+faststart"
+
+
+def _ffmpeg_threads() -> int:
+    """Encoder threads per ffmpeg: explicit setting, else split the cores across concurrent renders."""
+    if settings.ffmpeg_threads > 0:
+        return settings.ffmpeg_threads
+    return max(1, (os.cpu_count() or 1) // max(1, settings.render_concurrency))
+
+
+# Decoding a 1080p H.264 input stops scaling past ~3 threads
+DECODE_THREADS_MAX = 3
+
+
+def _decode_args() -> list[str]:
+    """Input-side -threads, so concurrent renders don't each spawn a decoder thread per core."""
+    return ["-threads", str(min(DECODE_THREADS_MAX, _ffmpeg_threads()))]
+
+
+def _x264_args() -> list[str]:
+    return [
+        "-c:v", "libx264",
+        "-threads", str(_ffmpeg_threads()),
+        "-preset", settings.x264_preset,
+        "-crf", "23",
+    ]
+
+
+async def _video_encoder() -> tuple[str, list[str]]:
+    """
+    (name, args) of the encoder for the primary render, per settings.hw_encoder:
+    "auto" takes the first hardware encoder that actually encodes a test
+    frame, a specific name (e.g. "h264_nvenc") tries only that one, and
+    anything else ("none", "libx264") stays on libx264. Resolved once per
+    process — builds often list nvenc/qsv without the hardware to back them.
+    """
+    global _video_encoder_choice
+    if _video_encoder_choice is not None:
+        return _video_encoder_choice
+    # Concurrent renders wait for the one detection instead of each seeing a
+    # half-finished answer
+    async with _video_encoder_lock:
+        if _video_encoder_choice is None:
+            _video_encoder_choice = await _detect_video_encoder()
+    return _video_encoder_choice
+
+
+async def _detect_video_encoder() -> tuple[str, list[str]]:
+    fallback = ("libx264", _x264_args())
+    wanted = settings.hw_encoder
+    if wanted == "auto":
+        candidates = list(_HW_ENCODER_ARGS)
+    elif wanted in _HW_ENCODER_ARGS:
+        candidates = [wanted]
+    else:
+        return fallback
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-hide_banner", "-encoders",
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+        )
+        listing, _ = await proc.communicate()
+    except OSError:
+        return fallback
+
+    for name in candidates:
+        if name.encode() not in listing:
+            continue
+        args = _HW_ENCODER_ARGS[name]
+        # Only the exit code matters here — no pipes to drain
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+            "-frames:v", "1", *args, "-f", "null", "-",
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+        )
+        returncode = await proc.wait()
+        if returncode == 0:
+            log.info(f"  Using hardware encoder: {name}")
+            return name, args
+    if wanted != "auto":
+        log.warning(f"  hw_encoder={wanted} unavailable → libx264")
+    return fallback
+
+
+# path -> (mtime_ns, size, parsed transcript); oldest entries dropped past the cap
+_transcript_cache: dict[str, tuple[int, int, dict]] = {}
+TRANSCRIPT_CACHE_SIZE = 32
+
+
+def _load_transcript(transcript_path: str) -> dict:
+    """
+    Parse a transcript JSON, reusing the parsed dict while the file is
+    unchanged (one stat instead of a re-read + re-parse). The dict is shared:
+    callers must not mutate it beyond derived caches like "_word_starts".
+    """
+    st = os.stat(transcript_path)
+    cached = _transcript_cache.get(transcript_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    with open(transcript_path, "rb") as f:
+        raw = f.read()
+    transcript = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    _transcript_cache.pop(transcript_path, None)
+    if len(_transcript_cache) >= TRANSCRIPT_CACHE_SIZE:
+        _transcript_cache.pop(next(iter(_transcript_cache)))
+    _transcript_cache[transcript_path] = (st.st_mtime_ns, st.st_size, transcript)
+    return transcript
+
+
+# (ok, clip_row_id, new_paths, fail_reason) — no reason means nothing to write
+RenderResult = tuple[bool, int, dict | None, str | None]
+
+
+RENDER_COMMIT_EVERY = 10
+
+
+def _write_render_results(db: sqlite3.Connection, results: list[RenderResult]) -> None:
+    """Apply a batch of render outcomes in one transaction."""
+    rendered = [
+        (ClipStatus.RENDERED.value, json.dumps(new_paths), clip_row_id)
+        for ok, clip_row_id, new_paths, _ in results if ok
+    ]
+    failed = [
+        (ClipStatus.FAILED.value, reason, clip_row_id)
+        for ok, clip_row_id, _, reason in results if not ok and reason
+    ]
+    with db:
+        if rendered:
+            db.executemany("""
+                UPDATE clips SET status = ?, paths_json = ?, updated_at = datetime('now')
+                WHERE id = ?
+            """, rendered)
+        if failed:
+            db.executemany("""
+                UPDATE clips SET status = ?, fail_reason = ?, updated_at = datetime('now')
+                WHERE id = ?
+            """, failed)
+
+
+async def render_clip(clip_row_id: int, db: sqlite3.Connection | None = None) -> bool:
+    """
+    Render one DECIDED clip and record the outcome. Uses the shared
+    connection unless the caller passes one; it is never closed here.
+    """
+    if db is None:
+        db = shared_db()
+    result = await _render_in_scratch(db, clip_row_id)
+    _write_render_results(db, [result])
+    return result[0]
+
+
+async def _render_in_scratch(db: sqlite3.Connection, clip_row_id: int) -> RenderResult:
+    """_render_clip in a fresh scratch dir, removed as soon as ffmpeg is done, whatever the outcome."""
+    with tempfile.TemporaryDirectory(prefix=f"clipforge-{clip_row_id}-", dir=SCRATCH_ROOT) as scratch:
+        return await _render_clip(db, clip_row_id, Path(scratch))
+
+
+async def _render_clip(db: sqlite3.Connection, clip_row_id: int, scratch_dir: Path) -> RenderResult:
     row = db.execute("""
         SELECT cl.*, p.rules_json, p.slug as profile_slug
         FROM clips cl
@@ -315,29 +912,25 @@ async def render_clip(clip_row_id: int) -> bool:
 
     if not row:
         log.warning(f"Clip {clip_row_id} not found or not DECIDED")
-        db.close()
-        return False
+        return False, clip_row_id, None, None
 
     paths = json.loads(row["paths_json"])
     source_path = paths.get("source")
     decision_path = paths.get("edit_decision")
     transcript_path = paths.get("transcript")
 
-    if not source_path or not Path(source_path).exists():
+    if not source_path or not os.path.isfile(source_path):
         log.error(f"Source missing for clip {clip_row_id}")
-        db.close()
-        return False
+        return False, clip_row_id, None, None
 
-    if not decision_path or not Path(decision_path).exists():
+    if not decision_path or not os.path.isfile(decision_path):
         log.error(f"Edit decision missing for clip {clip_row_id}")
-        db.close()
-        return False
+        return False, clip_row_id, None, None
 
     with open(decision_path) as f:
         ed = EditDecision.model_validate_json(f.read())
 
-    with open(transcript_path) as f:
-        transcript = json.load(f)
+    transcript = _load_transcript(transcript_path)
 
     clip_meta = ClipMeta.model_validate_json(row["metadata_json"])
     clip_title = _get_title(ed, clip_meta)
@@ -347,7 +940,12 @@ async def render_clip(clip_row_id: int) -> bool:
     if clip_title:
         log.info(f"  Title: {clip_title[:60]}")
 
-    probe = await probe_video(source_path)
+    # ffprobe, diarization and music lookup are independent — overlap them
+    probe, speaker_words, music_path = await asyncio.gather(
+        probe_video(source_path),
+        asyncio.to_thread(_diarized_words, source_path, transcript, ed.segment),
+        asyncio.to_thread(_pick_music_track),
+    )
     src_w = probe.get("width", 1920)
     src_h = probe.get("height", 1080)
     log.info(f"  Source: {src_w}x{src_h}")
@@ -359,121 +957,117 @@ async def render_clip(clip_row_id: int) -> bool:
     # Get bleep map for this segment
     bleep_map = get_bleep_map(transcript, ed.segment.start, ed.segment.end)
 
-    # ── Speaker diarization (optional) ────────────────────────────────────
-    speaker_words = None
-    try:
-        from src.render.diarize import diarize_speakers, assign_speakers_to_words
-
-        diarization_segments = diarize_speakers(
-            source_path,
-            segment_start=ed.segment.start,
-            segment_end=ed.segment.end,
-            min_speakers=1,
-            max_speakers=4,
-        )
-        if diarization_segments:
-            # Deep copy words to avoid mutating transcript
-            import copy
-            words_copy = copy.deepcopy(transcript.get("words", []))
-            speaker_words = assign_speakers_to_words(
-                words_copy,
-                diarization_segments,
-                segment_start=ed.segment.start,
-                segment_end=ed.segment.end,
-            )
-            unique = set(w.get("speaker", "SPEAKER_00") for w in speaker_words)
-            if len(unique) > 1:
-                log.info(f"  🎨 Speaker colors: {len(unique)} speakers → multi-color captions")
-            else:
-                log.info(f"  🎨 Single speaker → yellow captions")
-    except ImportError:
-        log.info("  Speaker diarization not available (pyannote not installed) → yellow captions")
-    except Exception as e:
-        log.warning(f"  Speaker diarization failed: {e} → yellow captions")
-
     # Build video filters
     video_layout = _build_video_filter(src_w, src_h)
 
-    caption_chain = _build_caption_filters(
-        transcript, ed.segment,
-        max_words=ed.captions.max_words,
-        speaker_words=speaker_words,
+    # captions.ass + title.png are disk writes (and a Pillow raster) — keep them off the loop
+    caption_chain, title_png = await asyncio.gather(
+        asyncio.to_thread(
+            _build_caption_filters,
+            transcript, ed.segment, scratch_dir,
+            max_words=ed.captions.max_words,
+            speaker_words=speaker_words,
+        ),
+        asyncio.to_thread(_render_title_png, _title_lines(clip_title), scratch_dir / "title.png"),
     )
 
+    # drawtext title is only used when title.png couldn't be rasterized
     title_filters = _build_title_filters(clip_title, duration=segment_duration)
 
     drawtext_chain = ""
     if caption_chain:
         drawtext_chain += "," + caption_chain
-    if title_filters:
+    if title_filters and not title_png:
         drawtext_chain += "," + title_filters
 
-    # Music handling
-    music_path = None
-    try:
-        from src.render.music_mixer import get_music_track
-        music_path = get_music_track(mood="funny")
-    except ImportError:
-        pass
-
     # Video chain: blur + overlay + captions + title -> [vout]
-    video_chain = video_layout + drawtext_chain + "[vout]"
+    if title_png:
+        title_input = 2 if music_path else 1
+        video_chain = (
+            video_layout + drawtext_chain
+            + f"[vcap];[vcap][{title_input}:v]overlay=0:0[vout]"
+        )
+    else:
+        video_chain = video_layout + drawtext_chain + "[vout]"
 
-    # Audio chain with bleeping
+    # Audio chain: loudnorm (+ bleeps), optionally mixed under music
     fade_start = max(0, segment_duration - 2.0)
-    bleep_filter = _build_bleep_audio_filter(bleep_map, ed.segment.start)
+    bleep_filter = _build_bleep_audio_filter(bleep_map, ed.segment.start, scratch_dir)
+
+    speech_filters = [LOUDNORM_FILTER]
+    if bleep_filter:
+        speech_filters.append(bleep_filter)
+    speech_chain = ",".join(speech_filters)
+
+    # Nothing to mix or mute and the source is already AAC: copy the audio
+    # untouched instead of decode → loudnorm → re-encode (opt-in: skips loudnorm)
+    copy_audio = (
+        settings.audio_passthrough
+        and not music_path
+        and not bleep_filter
+        and probe.get("audio_codec") == "aac"
+        and probe.get("sample_rate") in (44100, 48000)
+    )
 
-    if music_path:
-        if bleep_filter:
-            audio_chain = (
-                f"[0:a]loudnorm=I=-14:TP=-1:LRA=11,{bleep_filter}[speech];"
-                f"[1:a]atrim=0:{segment_duration:.1f},"
-                f"afade=t=in:st=0:d=1.0,"
-                f"afade=t=out:st={fade_start:.1f}:d=2.0,"
-                f"volume=0.10[music];"
-                f"[speech][music]amix=inputs=2:duration=first:dropout_transition=2[aout]"
-            )
-        else:
-            audio_chain = (
-                f"[0:a]loudnorm=I=-14:TP=-1:LRA=11[speech];"
-                f"[1:a]atrim=0:{segment_duration:.1f},"
-                f"afade=t=in:st=0:d=1.0,"
-                f"afade=t=out:st={fade_start:.1f}:d=2.0,"
-                f"volume=0.10[music];"
-                f"[speech][music]amix=inputs=2:duration=first:dropout_transition=2[aout]"
-            )
-    else:
-        if bleep_filter:
-            audio_chain = f"[0:a]loudnorm=I=-14:TP=-1:LRA=11,{bleep_filter}[aout]"
-        else:
-            audio_chain = "[0:a]loudnorm=I=-14:TP=-1:LRA=11[aout]"
+    # 1080x1920 source with nothing burned in: copy the video stream as-is.
+    # A copied stream starts at the keyframe before the seek point, so only
+    # when the audio is copied too (no bleeps) — otherwise re-encoded audio
+    # and its mute times would drift from the picture by up to one GOP
+    copy_video = (
+        copy_audio
+        and (src_w, src_h) == (1080, 1920)
+        and not drawtext_chain
+        and not title_png
+    )
 
-    full_filter = video_chain + ";" + audio_chain
+    filter_parts = []
+    if copy_video:
+        encoder_name = "copy"
+        video_args = ["-map", "0:v:0", "-c:v", "copy", "-avoid_negative_ts", "make_zero"]
+    else:
+        encoder_name, encoder_args = await _video_encoder()
+        filter_parts.append(video_chain)
+        video_args = ["-map", "[vout]", *encoder_args]
 
-    filter_script = clip_dir / "filter_script.txt"
-    with open(filter_script, "w") as f:
-        f.write(full_filter)
+    if copy_audio:
+        audio_args = ["-map", "0:a:0", "-c:a", "copy"]
+    else:
+        if music_path:
+            audio_chain = MUSIC_MIX_TEMPLATE.format(
+                speech=speech_chain, duration=segment_duration, fade_start=fade_start,
+            )
+        else:
+            audio_chain = f"[0:a]{speech_chain}[aout]"
+        filter_parts.append(audio_chain)
+        audio_args = ["-map", "[aout]", "-c:a", "aac", "-b:a", "128k", "-ar", "44100"]
+
+    full_filter = ";".join(filter_parts)
+    filter_args, script_stdin = [], None
+    if full_filter:
+        filter_args, script_stdin = await _filter_graph_args(
+            "-filter_complex", full_filter, scratch_dir / "filter_script.txt",
+        )
 
     # Build command — BUG 4 FIX: -t is now BEFORE -i source_path
-    cmd = [
-        "ffmpeg", "-y",
+    cmd = ["ffmpeg", "-y", "-nostdin", "-nostats", "-loglevel", "error"]
+    if encoder_name not in ("libx264", "copy"):
+        # GPU path: decode on the hardware too (frames come back for the filters)
+        cmd += _HW_DECODE_ARGS.get(encoder_name, ["-hwaccel", "auto"])
+    cmd += [
+        *_decode_args(),
         "-ss", str(ed.segment.start),
         "-t", str(segment_duration),
         "-i", source_path,
     ]
     if music_path:
         cmd += ["-i", music_path]
+    if title_png:
+        cmd += ["-i", str(title_png)]
     cmd += [
-        "-filter_complex_script", str(filter_script),
-        "-map", "[vout]",
-        "-map", "[aout]",
-        "-c:v", "libx264",
-        "-preset", "medium",
-        "-crf", "23",
-        "-c:a", "aac",
-        "-b:a", "128k",
-        "-ar", "44100",
-        "-movflags", "+faststart",
+        *filter_args,
+        *video_args,
+        *audio_args,
+        "-movflags", _movflags(),
         str(output_path),
     ]
 
@@ -483,82 +1077,66 @@ async def render_clip(clip_row_id: int) -> bool:
     has_speakers = f" + {len(set(w.get('speaker','') for w in (speaker_words or [])))} speakers" if speaker_words else ""
     log.info(f"  Running ffmpeg (blur + captions{has_word_ts}{has_bleeps}{has_speakers}{has_music})...")
 
-    proc = await asyncio.create_subprocess_exec(
-        *cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    stdout, stderr = await proc.communicate()
+    returncode, stderr = await _run_ffmpeg(cmd, stdin_data=script_stdin)
 
-    if proc.returncode != 0:
+    if returncode != 0:
         err_text = stderr.decode()[-800:]
         log.error(f"  ffmpeg failed:\n{err_text}")
 
-        # Fallback: simple layout (no blur)
+        # Fallback: simple layout (no blur), always on libx264
         log.info("  Retrying with simple layout...")
-        vf_simple = "scale=1080:1920:force_original_aspect_ratio=decrease,pad=1080:1920:(ow-iw)/2:(oh-ih)/2"
+        vf_simple = PAD_LAYOUT
         if caption_chain:
             vf_simple += "," + caption_chain
         if title_filters:
             vf_simple += "," + title_filters
 
-        fallback_script = clip_dir / "filter_fallback.txt"
-        with open(fallback_script, "w") as f:
-            f.write(vf_simple)
+        fallback_args, fallback_stdin = await _filter_graph_args(
+            "-filter:v", vf_simple, scratch_dir / "filter_fallback.txt",
+        )
 
-        af_simple = "loudnorm=I=-14:TP=-1:LRA=11"
-        if bleep_filter:
-            af_simple += f",{bleep_filter}"
+        af_simple = speech_chain
 
         cmd_simple = [
-            "ffmpeg", "-y",
+            "ffmpeg", "-y", "-nostdin", "-nostats", "-loglevel", "error",
+            *_decode_args(),
             "-ss", str(ed.segment.start),
             "-t", str(segment_duration),
             "-i", source_path,
-            "-filter_script:v", str(fallback_script),
+            *fallback_args,
             "-af", af_simple,
-            "-c:v", "libx264", "-preset", "medium", "-crf", "23",
+            *_x264_args(),
             "-c:a", "aac", "-b:a", "128k", "-ar", "44100",
-            "-movflags", "+faststart",
+            "-movflags", _movflags(),
             str(output_path),
         ]
-        proc2 = await asyncio.create_subprocess_exec(
-            *cmd_simple,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        _, stderr2 = await proc2.communicate()
-        if proc2.returncode != 0:
+        returncode2, stderr2 = await _run_ffmpeg(cmd_simple, stdin_data=fallback_stdin)
+        if returncode2 != 0:
             log.error(f"  Simple layout also failed:\n{stderr2.decode()[-500:]}")
 
             log.info("  Retrying without captions...")
+            # Source already 1080x1920: PAD_LAYOUT is a no-op, so copy the video
+            # stream (cut snaps to the keyframe before -ss) instead of re-encoding
+            if (src_w, src_h) == (1080, 1920):
+                bare_video = ["-c:v", "copy"]
+            else:
+                bare_video = ["-vf", PAD_LAYOUT, *_x264_args()]
             cmd_bare = [
-                "ffmpeg", "-y",
+                "ffmpeg", "-y", "-nostdin", "-nostats", "-loglevel", "error",
+                *_decode_args(),
                 "-ss", str(ed.segment.start),
                 "-t", str(segment_duration),
                 "-i", source_path,
-                "-vf", "scale=1080:1920:force_original_aspect_ratio=decrease,pad=1080:1920:(ow-iw)/2:(oh-ih)/2",
-                "-af", "loudnorm=I=-14:TP=-1:LRA=11",
-                "-c:v", "libx264", "-preset", "medium", "-crf", "23",
+                "-af", LOUDNORM_FILTER,
+                *bare_video,
                 "-c:a", "aac", "-b:a", "128k", "-ar", "44100",
-                "-movflags", "+faststart",
+                "-movflags", _movflags(),
                 str(output_path),
             ]
-            proc3 = await asyncio.create_subprocess_exec(
-                *cmd_bare,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            _, stderr3 = await proc3.communicate()
-            if proc3.returncode != 0:
+            returncode3, stderr3 = await _run_ffmpeg(cmd_bare)
+            if returncode3 != 0:
                 log.error(f"  All render attempts failed:\n{stderr3.decode()[-500:]}")
-                db.execute("""
-                    UPDATE clips SET status = ?, fail_reason = 'render_failed', updated_at = datetime('now')
-                    WHERE id = ?
-                """, (ClipStatus.FAILED.value, clip_row_id))
-                db.commit()
-                db.close()
-                return False
+                return False, clip_row_id, None, "render_failed"
             else:
                 log.warning("  Rendered WITHOUT captions or bleeps (bare fallback)")
         else:
@@ -566,33 +1144,20 @@ async def render_clip(clip_row_id: int) -> bool:
 
     if not output_path.exists() or output_path.stat().st_size < 1000:
         log.error(f"  Output file missing or too small")
-        db.execute("""
-            UPDATE clips SET status = ?, fail_reason = 'render_output_invalid', updated_at = datetime('now')
-            WHERE id = ?
-        """, (ClipStatus.FAILED.value, clip_row_id))
-        db.commit()
-        db.close()
-        return False
-
-    out_probe = await probe_video(str(output_path))
-    out_w = out_probe.get("width", 0)
-    out_h = out_probe.get("height", 0)
+        return False, clip_row_id, None, "render_output_invalid"
+
+    # Every render path scales/pads to 1080x1920, so no need to ffprobe the output
     file_size_mb = output_path.stat().st_size / 1024 / 1024
 
     paths["rendered"] = str(output_path)
-    db.execute("""
-        UPDATE clips SET status = ?, paths_json = ?, updated_at = datetime('now')
-        WHERE id = ?
-    """, (ClipStatus.RENDERED.value, json.dumps(paths), clip_row_id))
-    db.commit()
-    db.close()
 
-    log.info(f"  ✅ Rendered: {out_w}x{out_h}, {file_size_mb:.1f} MB, {segment_duration:.1f}s")
-    return True
+    log.info(f"  ✅ Rendered: 1080x1920, {file_size_mb:.1f} MB, {segment_duration:.1f}s")
+    return True, clip_row_id, paths, None
 
 
 async def render_decided_clips(profile_slug: str, limit: int = 10) -> dict:
-    db = get_db()
+    # Long-lived per-thread connection shared by every clip in the batch
+    db = shared_db()
     rows = db.execute("""
         SELECT cl.id FROM clips cl
         JOIN profiles p ON p.id = cl.profile_id
@@ -600,13 +1165,26 @@ async def render_decided_clips(profile_slug: str, limit: int = 10) -> dict:
         ORDER BY cl.created_at ASC
         LIMIT ?
     """, (profile_slug, ClipStatus.DECIDED.value, limit)).fetchall()
-    db.close()
 
-    stats = {"total": len(rows), "rendered": 0, "failed": 0}
-    for row in rows:
-        ok = await render_clip(row["id"])
-        if ok:
-            stats["rendered"] += 1
-        else:
-            stats["failed"] += 1
-    return stats
\ No newline at end of file
+    # ffmpeg is the bottleneck, not Python — run a few encodes side by side
+    sem = asyncio.Semaphore(max(1, settings.render_concurrency))
+
+    async def _one(clip_row_id: int) -> RenderResult:
+        async with sem:
+            return await _render_in_scratch(db, clip_row_id)
+
+    # One commit per RENDER_COMMIT_EVERY finished clips instead of one per clip,
+    # so a crash mid-batch loses at most that many status updates
+    rendered = 0
+    pending: list[RenderResult] = []
+    for fut in asyncio.as_completed([_one(row["id"]) for row in rows]):
+        result = await fut
+        rendered += result[0]
+        pending.append(result)
+        if len(pending) >= RENDER_COMMIT_EVERY:
+            _write_render_results(db, pending)
+            pending = []
+    if pending:
+        _write_render_results(db, pending)
+
+    return {"total": len(rows), "rendered": rendered, "failed": len(rows) - rendered}
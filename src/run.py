@@ -15,48 +15,40 @@ Usage:
     python -m src.run --profile funny-streamers
     python -m src.run --profile funny-streamers --skip-discover
     python -m src.run --top 20    # only package the 20 highest-scoring clips
+    python -m src.run --render-workers 4 --ffmpeg-threads 2
 """
 import asyncio
 import argparse
-import json
+import bisect
 import shutil
-from datetime import datetime
 from pathlib import Path
 from rich import print as rprint
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 
-from src.db.database import init_db, get_db
-from src.discovery.discover import discover_for_profile
-from src.download.downloader import download_discovered_clips
-from src.transcribe.transcriber import transcribe_downloaded_clips
-from src.decide.decider import decide_transcribed_clips
-from src.render.renderer import render_decided_clips
-from src.package.packager import package_rendered_clips
+from src.db.database import init_db, pipeline_counts, shared_db
+from src.config import settings
 from src.utils.log import log
 
+# Stage modules (discovery clients, whisper, renderer, ...) are imported inside
+# the steps that use them, so --help and no-op runs don't pay for loading them.
+
 console = Console()
 
 
 # ── Clean previous run ─────────────────────────────────────────────────────────
 
-def clean_previous_run() -> dict:
-    """
-    Wipe all data from previous runs so each daily run starts fresh.
-    Deletes: assets/, outputs/, archives/, and all clip rows from DB.
-    Preserves: profiles, creators, profile_creators, cursors (so discovery
-    knows where it left off and only fetches last 24h).
-    """
-    stats = {"assets_mb": 0, "clips_deleted": 0}
+def clean_previous_files() -> float:
+    """Delete assets/, outputs/ and archives/. Returns MB of assets freed."""
+    assets_bytes = 0
 
     # Delete asset files
     assets_dir = Path("assets")
     if assets_dir.exists():
         for f in assets_dir.rglob("*"):
             if f.is_file():
-                stats["assets_mb"] += f.stat().st_size
+                assets_bytes += f.stat().st_size
         shutil.rmtree(assets_dir)
-    stats["assets_mb"] = round(stats["assets_mb"] / 1024 / 1024, 1)
 
     # Delete outputs
     outputs_dir = Path("outputs")
@@ -68,56 +60,78 @@ def clean_previous_run() -> dict:
     if archives_dir.exists():
         shutil.rmtree(archives_dir)
 
-    # Delete all clip rows from DB (keep profiles, creators, cursors)
-    db = get_db()
-    count = db.execute("SELECT COUNT(*) as cnt FROM clips").fetchone()["cnt"]
-    db.execute("DELETE FROM clips")
-    db.commit()
-    db.close()
-    stats["clips_deleted"] = count
-
-    return stats
-
+    return round(assets_bytes / 1024 / 1024, 1)
 
-# ── Auto-archive ──────────────────────────────────────────────────────────────
 
-def archive_existing_outputs(profile_slug: str) -> int:
+def clean_previous_clips() -> int:
     """
-    Move existing output packs from outputs/{profile_slug}/ into
-    archives/{profile_slug}/{YYYY-MM-DD}/
-
-    Returns count of packs archived.
+    Delete all clip rows so each daily run starts fresh. Returns rows deleted.
+    Preserves profiles, creators, profile_creators and cursors (so discovery
+    knows where it left off and only fetches the last 24h).
     """
-    outputs_dir = Path("outputs") / profile_slug
-    if not outputs_dir.exists():
-        return 0
+    db = shared_db()
+    with db:
+        count = db.execute("SELECT COUNT(*) as cnt FROM clips").fetchone()["cnt"]
+        db.execute("DELETE FROM clips")
+    return count
 
-    packs = [d for d in outputs_dir.iterdir() if d.is_dir()]
-    if not packs:
-        return 0
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    archive_dir = Path("archives") / profile_slug / today
+# ── Top-N selection ───────────────────────────────────────────────────────────
 
-    if archive_dir.exists():
-        counter = 2
-        while archive_dir.exists():
-            archive_dir = Path("archives") / profile_slug / f"{today}-{counter}"
-            counter += 1
+# Cut scores shown at each end of the "Cut N clips" line
+CUT_PREVIEW = 10
 
-    archive_dir.mkdir(parents=True, exist_ok=True)
+# Fixed SQL text so sqlite3's per-connection statement cache hits on every call
+_STMT_RENDERED_COUNT = """
+    SELECT COUNT(*) as cnt FROM clips cl
+    JOIN profiles p ON p.id = cl.profile_id
+    WHERE p.slug = ? AND cl.status = 'RENDERED'
+"""
 
-    archived = 0
-    for pack_dir in packs:
-        dest = archive_dir / pack_dir.name
-        shutil.move(str(pack_dir), str(dest))
-        archived += 1
+# Both top-N reads walk idx_clips_status_score in order — no sort of the full set
+_STMT_TOP_RENDERED = """
+    SELECT cl.id, cl.viral_score, cl.clip_id, c.display_name
+    FROM clips cl
+    JOIN profiles p ON p.id = cl.profile_id
+    JOIN creators c ON c.id = cl.creator_id
+    WHERE p.slug = ? AND cl.status = 'RENDERED'
+    ORDER BY cl.viral_score DESC, cl.updated_at ASC
+    LIMIT ?
+"""
 
-    log.info(f"📦 Archived {archived} output packs → {archive_dir}")
-    return archived
+# First scores below the cut (LIMIT ? OFFSET top_n), and the last ones read backwards
+_STMT_CUT_HEAD_SCORES = """
+    SELECT cl.viral_score
+    FROM clips cl
+    JOIN profiles p ON p.id = cl.profile_id
+    WHERE p.slug = ? AND cl.status = 'RENDERED'
+    ORDER BY cl.viral_score DESC, cl.updated_at ASC
+    LIMIT ? OFFSET ?
+"""
 
+_STMT_CUT_TAIL_SCORES = """
+    SELECT cl.viral_score
+    FROM clips cl
+    JOIN profiles p ON p.id = cl.profile_id
+    WHERE p.slug = ? AND cl.status = 'RENDERED'
+    ORDER BY cl.viral_score ASC, cl.updated_at DESC
+    LIMIT ?
+"""
+
+# Everything past the top N, demoted inside SQLite — no ids round-trip through Python
+_STMT_DEMOTE_CUT = """
+    UPDATE clips SET status = 'SKIPPED', fail_reason = 'cut:below_top_n',
+        updated_at = datetime('now')
+    WHERE id IN (
+        SELECT cl.id
+        FROM clips cl
+        JOIN profiles p ON p.id = cl.profile_id
+        WHERE p.slug = ? AND cl.status = 'RENDERED'
+        ORDER BY cl.viral_score DESC, cl.updated_at ASC
+        LIMIT -1 OFFSET ?
+    )
+"""
 
-# ── Top-N selection ───────────────────────────────────────────────────────────
 
 def select_top_clips(profile_slug: str, top_n: int) -> int:
     """
@@ -125,91 +139,211 @@ def select_top_clips(profile_slug: str, top_n: int) -> int:
     Demotes the rest to SKIPPED so they can be reconsidered in future runs.
     Returns count of clips that made the cut.
     """
-    db = get_db()
-
-    rendered = db.execute("""
-        SELECT cl.id, cl.viral_score, cl.clip_id, c.display_name
-        FROM clips cl
-        JOIN profiles p ON p.id = cl.profile_id
-        JOIN creators c ON c.id = cl.creator_id
-        WHERE p.slug = ? AND cl.status = 'RENDERED'
-        ORDER BY cl.viral_score DESC, cl.updated_at ASC
-    """, (profile_slug,)).fetchall()
+    db = shared_db()
 
-    total = len(rendered)
+    total = db.execute(_STMT_RENDERED_COUNT, (profile_slug,)).fetchone()["cnt"]
 
     if total <= top_n:
         log.info(f"🏆 All {total} rendered clips make the cut (≤ {top_n})")
-        db.close()
         return total
 
-    # Top N stay as RENDERED, rest get demoted
-    keep_ids = [row["id"] for row in rendered[:top_n]]
-    cut_ids = [row["id"] for row in rendered[top_n:]]
+    top = db.execute(_STMT_TOP_RENDERED, (profile_slug, top_n)).fetchall()
+
+    # Python only ever sees the leaderboard and the previewed cut scores
+    cut_count = total - len(top)
+    head = [r[0] or 0 for r in db.execute(_STMT_CUT_HEAD_SCORES, (profile_slug, CUT_PREVIEW, top_n))]
+    tail_n = min(CUT_PREVIEW, cut_count - len(head))
+    tail = [r[0] or 0 for r in db.execute(_STMT_CUT_TAIL_SCORES, (profile_slug, tail_n))][::-1]
 
     # Show the leaderboard
-    rprint(f"\n[bold]🏆 Top {top_n} clips by viral score:[/bold]")
     table = Table(show_header=True)
     table.add_column("#", style="bold")
     table.add_column("Score", style="cyan")
     table.add_column("Creator")
     table.add_column("Clip ID")
-    for i, row in enumerate(rendered[:top_n], 1):
-        score = row["viral_score"] or 0
-        table.add_row(
-            str(i),
-            f"{score}/10",
-            row["display_name"],
-            row["clip_id"][:40] + "...",
-        )
-    console.print(table)
+    rows = [
+        (str(i), f"{row['viral_score'] or 0}/10", row["display_name"], row["clip_id"][:40] + "...")
+        for i, row in enumerate(top, 1)
+    ]
+    for cells in rows:
+        table.add_row(*cells)
 
     # Show what didn't make it
-    cut_scores = [str(r["viral_score"] or 0) for r in rendered[top_n:]]
-    rprint(f"[dim]  Cut {len(cut_ids)} clips (scores: {', '.join(cut_scores)})[/dim]")
+    # First/last CUT_PREVIEW scores only, however big the backlog
+    preview = ", ".join(map(str, head))
+    hidden = cut_count - len(head) - len(tail)
+    if hidden:
+        preview += f", … (+{hidden} more)"
+    if tail:
+        preview += ", " + ", ".join(map(str, tail))
+
+    # Heading, leaderboard and cut line rendered in a single pass
+    console.print(Group(
+        f"\n[bold]🏆 Top {top_n} clips by viral score:[/bold]",
+        table,
+        f"[dim]  Cut {cut_count} clips (scores: {preview})[/dim]",
+    ))
+
+    # Top N stay as RENDERED; demote the rest — SKIPPED so they can be
+    # reconsidered in future runs
+    with db:
+        db.execute(_STMT_DEMOTE_CUT, (profile_slug, top_n))
+
+    return len(top)
+
+
+def guaranteed_top_clips(profile_slug: str, top_n: int) -> set[int]:
+    """
+    Clips certain to make the top N before anything is rendered: fewer than N
+    other candidates (DECIDED or RENDERED) score at least as high, so no render
+    outcome or tie-break can push them out. These can be packaged straight off
+    the render stream.
+    """
+    db = shared_db()
+    rows = db.execute("""
+        SELECT cl.id, cl.viral_score FROM clips cl
+        JOIN profiles p ON p.id = cl.profile_id
+        WHERE p.slug = ? AND cl.status IN ('DECIDED', 'RENDERED')
+    """, (profile_slug,)).fetchall()
+
+    scores = sorted(r["viral_score"] or 0 for r in rows)
+    return {
+        r["id"] for r in rows
+        if len(scores) - bisect.bisect_left(scores, r["viral_score"] or 0) - 1 < top_n
+    }
 
-    # Demote cut clips — use SKIPPED so they can be reconsidered in future runs
-    for cid in cut_ids:
-        db.execute("""
-            UPDATE clips SET status = 'SKIPPED', fail_reason = 'cut:below_top_n',
-                updated_at = datetime('now')
-            WHERE id = ?
-        """, (cid,))
 
-    db.commit()
-    db.close()
+# ── Stage workers ─────────────────────────────────────────────────────────────
+
+# How often an idle stage re-checks SQLite for new input
+STAGE_POLL_SEC = 0.5
+
+_STMT_CLIP_IDS = """
+    SELECT cl.id FROM clips cl
+    JOIN profiles p ON p.id = cl.profile_id
+    WHERE p.slug = ? AND cl.status = ?
+    ORDER BY cl.created_at ASC
+"""
+
 
-    return len(keep_ids)
+def _clip_ids(profile_slug: str, status: str) -> list[int]:
+    db = shared_db()
+    rows = db.execute(_STMT_CLIP_IDS, (profile_slug, status)).fetchall()
+    return [row["id"] for row in rows]
+
+
+async def stage_worker(
+    profile_slug: str,
+    status: str,
+    handle,
+    stats: dict,
+    upstream_done: asyncio.Event,
+    done: asyncio.Event,
+    concurrency: int = 1,
+    delay: float = 0.0,
+    limit: int = 100,
+    only: set[int] | None = None,
+):
+    """
+    Run `handle(clip_id)` on every clip that reaches `status`, up to `limit`,
+    while the upstream stage is still producing. Sets `done` once upstream is
+    done, nothing new is waiting, and every in-flight clip has finished.
+    `delay` holds the slot after each clip (API/rate-limit spacing).
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+    seen: set[int] = set()
+
+    async def _one(clip_id: int):
+        async with sem:
+            ok = await handle(clip_id)
+            stats["ok" if ok else "failed"] += 1
+            if delay:
+                await asyncio.sleep(delay)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            while True:
+                # Read the flag before querying so a last batch can't slip past
+                finished = upstream_done.is_set()
+                new = [
+                    cid for cid in await asyncio.to_thread(_clip_ids, profile_slug, status)
+                    if cid not in seen and (only is None or cid in only)
+                ][:max(0, limit - len(seen))]
+                for cid in new:
+                    seen.add(cid)
+                    tg.create_task(_one(cid))
+                if finished and not new:
+                    break
+                await asyncio.sleep(STAGE_POLL_SEC)
+    finally:
+        done.set()
 
 
 # ── Pipeline status ───────────────────────────────────────────────────────────
 
+# Statuses that still have stage work ahead of them (steps 2–5)
+PENDING_STATUSES = ("DISCOVERED", "DOWNLOADED", "TRANSCRIBED", "DECIDED")
+
+
 def show_pipeline_status(profile_slug: str):
     """Show current clip counts by status."""
-    db = get_db()
-    rows = db.execute("""
-        SELECT cl.status, COUNT(*) as cnt
-        FROM clips cl
-        JOIN profiles p ON p.id = cl.profile_id
-        WHERE p.slug = ?
-        GROUP BY cl.status ORDER BY cl.status
-    """, (profile_slug,)).fetchall()
-    db.close()
+    counts = pipeline_counts(shared_db(), profile_slug)
 
     emoji_map = {
         "DISCOVERED": "🔍", "DOWNLOADED": "⬇️", "TRANSCRIBED": "📝",
         "DECIDED": "🧠", "RENDERED": "🎬", "PACKAGED": "📦",
         "SKIPPED": "⏭️", "FAILED": "❌",
     }
-    rprint("\n[bold]Pipeline Status:[/bold]")
-    for r in rows:
-        e = emoji_map.get(r["status"], "?")
-        rprint(f"  {e} {r['status']}: {r['cnt']}")
-    rprint("")
+    lines = ["\n[bold]Pipeline Status:[/bold]"]
+    for status, cnt in counts.items():
+        e = emoji_map.get(status, "?")
+        lines.append(f"  {e} {status}: {cnt}")
+    rprint("\n".join(lines) + "\n")
 
 
 # ── Main pipeline ─────────────────────────────────────────────────────────────
 
+async def _run_stages(profile_slug: str, top_n: int, stats: dict, warm_transcriber: bool = True):
+    """Steps 2–5 as overlapped stage workers; fills `stats` per stage."""
+    from src.download.downloader import download_clip
+    from src.transcribe.transcriber import transcribe_clip, transcribe_workers, warm_up
+    from src.decide.decider import decide_clip
+    from src.render.renderer import render_clip
+    from src.package.packager import package_clip
+
+    rprint("[bold]Steps 2–5/6: Downloading, transcribing, deciding, rendering...[/bold]")
+    done = {name: asyncio.Event() for name in stats}
+    no_upstream = asyncio.Event()
+    no_upstream.set()
+
+    async def _early_package():
+        # Once every score is known, clips certain to make the top N are
+        # packaged as they come out of the renderer
+        await done["decide"].wait()
+        early = await asyncio.to_thread(guaranteed_top_clips, profile_slug, top_n)
+        await stage_worker(profile_slug, "RENDERED", package_clip, stats["early_package"],
+                           done["render"], done["early_package"], only=early)
+
+    async with asyncio.TaskGroup() as tg:
+        if warm_transcriber:
+            # Whisper loads while the first downloads are in flight
+            tg.create_task(asyncio.to_thread(warm_up))
+        tg.create_task(stage_worker(profile_slug, "DISCOVERED", download_clip, stats["download"],
+                                    no_upstream, done["download"],
+                                    concurrency=settings.download_concurrency,
+                                    delay=settings.request_delay_sec))
+        tg.create_task(stage_worker(profile_slug, "DOWNLOADED", transcribe_clip, stats["transcribe"],
+                                    done["download"], done["transcribe"],
+                                    concurrency=transcribe_workers()))
+        tg.create_task(stage_worker(profile_slug, "TRANSCRIBED", decide_clip, stats["decide"],
+                                    done["transcribe"], done["decide"],
+                                    concurrency=settings.decide_concurrency, delay=1.0))
+        tg.create_task(stage_worker(profile_slug, "DECIDED", render_clip, stats["render"],
+                                    done["decide"], done["render"],
+                                    concurrency=settings.render_concurrency))
+        tg.create_task(_early_package())
+
+
 async def run_pipeline(
     profile_slug: str,
     skip_discover: bool = False,
@@ -217,79 +351,81 @@ async def run_pipeline(
     top_n: int = 20,
 ):
     """Run the full pipeline."""
-    rprint(f"\n[bold cyan]══ ClipForge Pipeline: {profile_slug} ══[/bold cyan]")
-    rprint(f"[dim]Top {top_n} clips will be packaged[/dim]\n")
+    rprint(f"\n[bold cyan]══ ClipForge Pipeline: {profile_slug} ══[/bold cyan]\n"
+           f"[dim]Top {top_n} clips will be packaged[/dim]\n")
 
     # Ensure DB exists + run migrations
     init_db()
 
-    # ── Step 0: Clean previous run ──
-    cleaned = clean_previous_run()
-    if cleaned["clips_deleted"] > 0 or cleaned["assets_mb"] > 0:
-        rprint(f"[bold]Step 0: Cleaned previous run[/bold]")
-        rprint(f"  → Deleted {cleaned['clips_deleted']} old clips, freed {cleaned['assets_mb']} MB\n")
+    # ── Steps 0 + 1: Clean previous run while discovering ──
+    # Old clip rows must go before discovery inserts new ones; deleting old
+    # files doesn't touch anything discovery uses, so it runs on a thread
+    # while the (network-bound) discovery is in flight.
+    clips_deleted = clean_previous_clips()
+    files_cleaned = asyncio.create_task(asyncio.to_thread(clean_previous_files))
+    if not skip_discover:
+        rprint("[bold]Step 0 + 1/6: Cleaning previous run, discovering new clips...[/bold]")
+        from src.discovery.discover import discover_for_profile
+        assets_mb, new_clips = await asyncio.gather(
+            files_cleaned,
+            discover_for_profile(profile_slug, max_per_creator=limit_per_creator),
+        )
+    else:
+        assets_mb = await files_cleaned
+
+    if clips_deleted > 0 or assets_mb > 0:
+        rprint(f"[bold]Step 0: Cleaned previous run[/bold]\n"
+               f"  → Deleted {clips_deleted} old clips, freed {assets_mb} MB\n")
     else:
         rprint("[dim]Step 0: Nothing to clean[/dim]\n")
-
-    # ── Step 1: Discover ──
     if not skip_discover:
-        rprint("[bold]Step 1/6: Discovering new clips...[/bold]")
-        new_clips = await discover_for_profile(profile_slug, max_per_creator=limit_per_creator)
-        rprint(f"  → {len(new_clips)} new clips discovered\n")
+        rprint(f"[bold]Step 1/6: Discovered new clips[/bold]\n"
+               f"  → {len(new_clips)} new clips discovered\n")
     else:
         rprint("[dim]Step 1/6: Skipped discovery[/dim]\n")
 
-    # ── Step 2: Download ──
-    rprint("[bold]Step 2/6: Downloading clips...[/bold]")
-    dl_count = await download_discovered_clips(profile_slug, limit=100)
-    rprint(f"  → {dl_count} clips downloaded\n")
-
-    if dl_count == 0:
-        db = get_db()
-        remaining = db.execute("""
-            SELECT COUNT(*) as cnt FROM clips cl
-            JOIN profiles p ON p.id = cl.profile_id
-            WHERE p.slug = ? AND cl.status = 'DISCOVERED'
-        """, (profile_slug,)).fetchone()["cnt"]
-        db.close()
-        if remaining == 0:
-            rprint("[yellow]  No clips to process. All clips already handled or none discovered.[/yellow]\n")
-
-    # ── Step 3: Transcribe ──
-    rprint("[bold]Step 3/6: Transcribing + quality gates...[/bold]")
-    t_stats = await transcribe_downloaded_clips(profile_slug, limit=100)
-    rprint(f"  → {t_stats['passed']} passed, {t_stats['failed']} filtered out\n")
-
-    # ── Step 4: LLM Decisions ──
-    rprint("[bold]Step 4/6: LLM edit decisions...[/bold]")
-    d_stats = await decide_transcribed_clips(profile_slug, limit=100)
-    rprint(f"  → {d_stats['decided']} decisions made\n")
-
-    # ── Step 5: Render ──
-    rprint("[bold]Step 5/6: Rendering shorts...[/bold]")
-    r_stats = await render_decided_clips(profile_slug, limit=100)
-    rprint(f"  → {r_stats['rendered']} shorts rendered\n")
-
-    # ── Step 5.5: Top-N selection ──
-    rprint(f"[bold]Selecting top {top_n} clips...[/bold]")
-    kept = select_top_clips(profile_slug, top_n)
-    rprint(f"  → {kept} clips selected for packaging\n")
-
-    # ── Step 6: Package ──
-    rprint("[bold]Step 6/6: Packaging publish packs...[/bold]")
-    p_stats = await package_rendered_clips(profile_slug, limit=top_n)
-    rprint(f"  → {p_stats['packaged']} packs ready\n")
+    # ── Steps 2–5: Download → transcribe → decide → render, overlapped ──
+    # Each stage picks up clips as soon as the previous one hands them over,
+    # so wall-clock tracks the slowest stage instead of the sum of all four.
+    names = ["download", "transcribe", "decide", "render", "early_package"]
+    stats = {name: {"ok": 0, "failed": 0} for name in names}
+    counts = pipeline_counts(shared_db(), profile_slug)
+    if not any(counts.get(s) for s in PENDING_STATUSES):
+        rprint("[dim]Steps 2–5/6: No clips to process — skipped[/dim]\n")
+    else:
+        await _run_stages(profile_slug, top_n, stats,
+                          warm_transcriber=bool(counts.get("DISCOVERED") or counts.get("DOWNLOADED")))
+        rprint(f"  → {stats['download']['ok']} downloaded, "
+               f"{stats['transcribe']['ok']} passed transcription ({stats['transcribe']['failed']} filtered out), "
+               f"{stats['decide']['ok']} decided, "
+               f"{stats['render']['ok']} rendered ({stats['early_package']['ok']} already packaged)\n")
+    early_packaged = stats["early_package"]["ok"]
+
+    # ── Steps 5.5 + 6: Top-N selection, then packaging the remaining slots ──
+    slots = top_n - early_packaged
+    p_stats = {"packaged": 0}
+    if not pipeline_counts(shared_db(), profile_slug).get("RENDERED"):
+        rprint("[dim]Step 6/6: Nothing rendered to package — skipped[/dim]\n")
+    else:
+        rprint(f"[bold]Selecting top {top_n} clips...[/bold]")
+        kept = select_top_clips(profile_slug, slots) + early_packaged
+        rprint(f"  → {kept} clips selected for packaging\n")
+
+        rprint("[bold]Step 6/6: Packaging publish packs...[/bold]")
+        if slots > 0:
+            from src.package.packager import package_rendered_clips
+            p_stats = await package_rendered_clips(profile_slug, limit=slots)
+        rprint(f"  → {p_stats['packaged'] + early_packaged} packs ready\n")
 
     # ── Summary ──
     show_pipeline_status(profile_slug)
 
-    total_new = p_stats["packaged"]
+    total_new = p_stats["packaged"] + early_packaged
     if total_new > 0:
-        rprint(f"[bold green]✅ {total_new} top shorts ready in outputs/{profile_slug}/[/bold green]")
+        outcome = f"[bold green]✅ {total_new} top shorts ready in outputs/{profile_slug}/[/bold green]"
     else:
-        rprint("[yellow]No new shorts produced this run.[/yellow]")
-
-    rprint(f"[bold cyan]══ Pipeline complete ══[/bold cyan]\n")
+        outcome = "[yellow]No new shorts produced this run.[/yellow]"
+    rprint(f"{outcome}\n[bold cyan]══ Pipeline complete ══[/bold cyan]\n")
 
 
 def main():
@@ -298,8 +434,16 @@ def main():
     parser.add_argument("--skip-discover", action="store_true", help="Skip discovery step")
     parser.add_argument("--limit", type=int, default=10, help="Max clips per creator to discover (Twitch sorts by views)")
     parser.add_argument("--top", type=int, default=20, help="Only package the top N clips by viral score")
+    parser.add_argument("--render-workers", type=int, help="Concurrent ffmpeg renders (default: RENDER_CONCURRENCY)")
+    parser.add_argument("--ffmpeg-threads", type=int,
+                        help="Encoder threads per render (default: cores / render workers)")
     args = parser.parse_args()
 
+    if args.render_workers:
+        settings.render_concurrency = args.render_workers
+    if args.ffmpeg_threads:
+        settings.ffmpeg_threads = args.ffmpeg_threads
+
     asyncio.run(run_pipeline(
         profile_slug=args.profile,
         skip_discover=args.skip_discover,
@@ -14,7 +14,7 @@ from rich.console import Console
 from src.db.database import init_db, get_db
 from src.models.schemas import ProfileRules
 from src.discovery.discover import discover_for_profile
-from src.discovery.twitch_api import get_broadcaster_id
+from src.discovery.twitch_api import get_app_token, get_broadcaster_id
 from src.download.downloader import download_discovered_clips
 from src.config import settings
 
@@ -67,6 +67,20 @@ CREATORS = [
 ]
 
 
+# Parallel Helix /users lookups while seeding
+TWITCH_LOOKUP_CONCURRENCY = 5
+
+_STMT_INSERT_CREATOR = """
+    INSERT OR IGNORE INTO creators (platform, platform_user_id, display_name, channel_url)
+    VALUES (?, ?, ?, ?)
+"""
+
+_STMT_LINK_CREATOR = """
+    INSERT OR IGNORE INTO profile_creators (profile_id, creator_id, is_enabled)
+    SELECT ?, id, 1 FROM creators WHERE platform = ? AND platform_user_id = ?
+"""
+
+
 async def seed_profile_and_creators():
     """Create profile + creators in DB."""
     rprint("\n[bold cyan]═══ ClipForge: Milestone 0 — Setup ═══[/bold cyan]\n")
@@ -75,26 +89,28 @@ async def seed_profile_and_creators():
     db = init_db()
     rprint("[green]✅ Database initialized[/green]")
 
-    # Create profile
-    rules_json = PROFILE["rules"].model_dump_json()
-    db.execute("""
-        INSERT OR IGNORE INTO profiles (slug, name, rules_json)
-        VALUES (?, ?, ?)
-    """, (PROFILE["slug"], PROFILE["name"], rules_json))
-    db.commit()
-
-    profile_row = db.execute("SELECT id FROM profiles WHERE slug = ?",
-                             (PROFILE["slug"],)).fetchone()
-    profile_id = profile_row["id"]
-    rprint(f"[green]✅ Profile created: {PROFILE['slug']} (id={profile_id})[/green]")
+    # Resolve Twitch logins -> broadcaster_ids a few at a time (fetch_json
+    # already backs off on 429s). Fetch the app token once up front so the
+    # concurrent lookups don't each request their own.
+    await get_app_token()
+    sem = asyncio.Semaphore(TWITCH_LOOKUP_CONCURRENCY)
+
+    async def _resolve(login: str) -> tuple[str, str | None]:
+        async with sem:
+            return login, await get_broadcaster_id(login)
 
-    # Add creators
+    broadcaster_ids = dict(await asyncio.gather(*(
+        _resolve(login) for platform, login, _ in CREATORS if platform == "twitch"
+    )))
+
+    # Then write all creators in one transaction
+    creator_rows = []
     for platform, login, display_name in CREATORS:
         platform_user_id = login  # default: use login as ID
 
-        # For Twitch, resolve login -> broadcaster_id
+        # For Twitch, use the resolved broadcaster_id
         if platform == "twitch":
-            bid = await get_broadcaster_id(login)
+            bid = broadcaster_ids[login]
             if bid:
                 platform_user_id = bid
                 rprint(f"  Twitch {login} -> broadcaster_id={bid}")
@@ -106,24 +122,23 @@ async def seed_profile_and_creators():
             f"https://twitch.tv/{login}" if platform == "twitch"
             else f"https://kick.com/{login}"
         )
+        creator_rows.append((platform, platform_user_id, display_name, channel_url))
 
+    # Profile, creators and links in one transaction (one commit)
+    rules_json = PROFILE["rules"].model_dump_json()
+    with db:
         db.execute("""
-            INSERT OR IGNORE INTO creators (platform, platform_user_id, display_name, channel_url)
-            VALUES (?, ?, ?, ?)
-        """, (platform, platform_user_id, display_name, channel_url))
-        db.commit()
-
-        creator_row = db.execute(
-            "SELECT id FROM creators WHERE platform = ? AND platform_user_id = ?",
-            (platform, platform_user_id)
-        ).fetchone()
-
-        if creator_row:
-            db.execute("""
-                INSERT OR IGNORE INTO profile_creators (profile_id, creator_id, is_enabled)
-                VALUES (?, ?, 1)
-            """, (profile_id, creator_row["id"]))
-            db.commit()
+            INSERT OR IGNORE INTO profiles (slug, name, rules_json)
+            VALUES (?, ?, ?)
+        """, (PROFILE["slug"], PROFILE["name"], rules_json))
+        profile_id = db.execute("SELECT id FROM profiles WHERE slug = ?",
+                                (PROFILE["slug"],)).fetchone()["id"]
+        db.executemany(_STMT_INSERT_CREATOR, creator_rows)
+        db.executemany(_STMT_LINK_CREATOR, [
+            (profile_id, platform, platform_user_id)
+            for platform, platform_user_id, _, _ in creator_rows
+        ])
+    rprint(f"[green]✅ Profile created: {PROFILE['slug']} (id={profile_id})[/green]")
 
     # Show summary
     creators = db.execute("""
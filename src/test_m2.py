@@ -40,7 +40,8 @@ async def main():
 
     # Show transcribed clips
     transcribed = db.execute("""
-        SELECT cl.id, cl.platform, cl.clip_id, cl.status, cl.paths_json,
+        SELECT cl.id, cl.platform, cl.clip_id, cl.status,
+               json_extract(cl.paths_json, '$.transcript') as transcript_path,
                c.display_name as creator
         FROM clips cl
         JOIN creators c ON c.id = cl.creator_id
@@ -56,11 +57,10 @@ async def main():
         table.add_column("Clip ID")
         table.add_column("Transcript Preview")
         for row in transcribed:
-            paths = json.loads(row["paths_json"])
             preview = ""
-            if paths.get("transcript"):
+            if row["transcript_path"]:
                 try:
-                    with open(paths["transcript"]) as f:
+                    with open(row["transcript_path"], encoding="utf-8") as f:
                         t = json.load(f)
                         preview = t.get("full_text", "")[:60] + "..."
                 except:
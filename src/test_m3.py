@@ -10,7 +10,7 @@ from rich import print as rprint
 from rich.table import Table
 from rich.console import Console
 
-from src.db.database import get_db
+from src.db.database import get_db, pipeline_counts
 from src.decide.decider import decide_transcribed_clips
 
 console = Console()
@@ -22,11 +22,7 @@ async def main():
 
     # Check how many TRANSCRIBED clips we have
     db = get_db()
-    count = db.execute("""
-        SELECT COUNT(*) as cnt FROM clips cl
-        JOIN profiles p ON p.id = cl.profile_id
-        WHERE p.slug = ? AND cl.status = 'TRANSCRIBED'
-    """, (PROFILE_SLUG,)).fetchone()["cnt"]
+    count = pipeline_counts(db, PROFILE_SLUG).get("TRANSCRIBED", 0)
     db.close()
 
     rprint(f"[cyan]Found {count} TRANSCRIBED clips ready for LLM decisions[/cyan]\n")
@@ -46,7 +42,8 @@ async def main():
     # Show decided clips
     db = get_db()
     decided = db.execute("""
-        SELECT cl.id, cl.platform, cl.clip_id, cl.paths_json,
+        SELECT cl.id, cl.platform, cl.clip_id,
+               json_extract(cl.paths_json, '$.edit_decision') as decision_path,
                c.display_name as creator
         FROM clips cl
         JOIN creators c ON c.id = cl.creator_id
@@ -56,8 +53,7 @@ async def main():
 
     if decided:
         for row in decided:
-            paths = json.loads(row["paths_json"])
-            decision_path = paths.get("edit_decision")
+            decision_path = row["decision_path"]
             if not decision_path:
                 continue
 
@@ -5,29 +5,31 @@ Usage:
     python -m src.test_m4
 """
 import asyncio
-import json
-from pathlib import Path
+import os
 from rich import print as rprint
 from rich.table import Table
 from rich.console import Console
 
-from src.db.database import get_db
+from src.db.database import get_db, pipeline_counts
 from src.render.renderer import render_decided_clips
 
 console = Console()
 PROFILE_SLUG = "funny-streamers"
 
 
+def _file_size(path: str) -> int | None:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
 async def main():
     rprint("\n[bold cyan]═══ ClipForge: Milestone 4 — Render Shorts ═══[/bold cyan]\n")
 
     # Check DECIDED clips
     db = get_db()
-    count = db.execute("""
-        SELECT COUNT(*) as cnt FROM clips cl
-        JOIN profiles p ON p.id = cl.profile_id
-        WHERE p.slug = ? AND cl.status = 'DECIDED'
-    """, (PROFILE_SLUG,)).fetchone()["cnt"]
+    count = pipeline_counts(db, PROFILE_SLUG).get("DECIDED", 0)
     db.close()
 
     rprint(f"[cyan]Found {count} DECIDED clips ready to render[/cyan]\n")
@@ -47,7 +49,8 @@ async def main():
     # Show rendered clips
     db = get_db()
     rendered = db.execute("""
-        SELECT cl.id, cl.platform, cl.clip_id, cl.paths_json,
+        SELECT cl.id, cl.platform, cl.clip_id,
+               json_extract(cl.paths_json, '$.rendered') as rendered_path,
                c.display_name as creator
         FROM clips cl
         JOIN creators c ON c.id = cl.creator_id
@@ -62,13 +65,17 @@ async def main():
         table.add_column("Resolution")
         table.add_column("Size")
         table.add_column("File")
-        for row in rendered:
-            paths = json.loads(row["paths_json"])
-            rendered_path = paths.get("rendered", "")
+        # Stat every file at once instead of one blocking call per row
+        rendered_paths = [row["rendered_path"] or "" for row in rendered]
+        sizes = await asyncio.gather(*(
+            asyncio.to_thread(_file_size, p) for p in rendered_paths if p
+        ))
+        size_of = dict(zip([p for p in rendered_paths if p], sizes))
+        for row, rendered_path in zip(rendered, rendered_paths):
             size = ""
             resolution = ""
-            if rendered_path and Path(rendered_path).exists():
-                size = f"{Path(rendered_path).stat().st_size / 1024 / 1024:.1f} MB"
+            if size_of.get(rendered_path) is not None:
+                size = f"{size_of[rendered_path] / 1024 / 1024:.1f} MB"
                 # Quick check via file name
                 resolution = "1080x1920"
             table.add_row(
@@ -5,28 +5,32 @@ Usage:
     python -m src.test_m5
 """
 import asyncio
-import json
+import os
 from pathlib import Path
 from rich import print as rprint
 from rich.table import Table
 from rich.console import Console
 
-from src.db.database import get_db
+from src.db.database import get_db, pipeline_counts
 from src.package.packager import package_rendered_clips
 
 console = Console()
 PROFILE_SLUG = "funny-streamers"
 
 
+def _file_count(pack_dir: str) -> int | None:
+    try:
+        with os.scandir(pack_dir) as it:
+            return sum(1 for _ in it)
+    except OSError:
+        return None
+
+
 async def main():
     rprint("\n[bold cyan]═══ ClipForge: Milestone 5 — Package Publish Packs ═══[/bold cyan]\n")
 
     db = get_db()
-    count = db.execute("""
-        SELECT COUNT(*) as cnt FROM clips cl
-        JOIN profiles p ON p.id = cl.profile_id
-        WHERE p.slug = ? AND cl.status = 'RENDERED'
-    """, (PROFILE_SLUG,)).fetchone()["cnt"]
+    count = pipeline_counts(db, PROFILE_SLUG).get("RENDERED", 0)
     db.close()
 
     rprint(f"[cyan]Found {count} RENDERED clips ready to package[/cyan]\n")
@@ -45,7 +49,8 @@ async def main():
     # Show packaged clips
     db = get_db()
     packaged = db.execute("""
-        SELECT cl.id, cl.platform, cl.clip_id, cl.paths_json,
+        SELECT cl.id, cl.platform, cl.clip_id,
+               json_extract(cl.paths_json, '$.publish_pack') as pack_dir,
                c.display_name as creator
         FROM clips cl
         JOIN creators c ON c.id = cl.creator_id
@@ -61,12 +66,16 @@ async def main():
         table.add_column("Pack Folder")
         table.add_column("Files")
 
-        for row in packaged:
-            paths = json.loads(row["paths_json"])
-            pack_dir = paths.get("publish_pack", "")
+        # List every pack folder at once instead of one blocking call per row
+        pack_dirs = [row["pack_dir"] or "" for row in packaged]
+        counts = await asyncio.gather(*(
+            asyncio.to_thread(_file_count, d) for d in pack_dirs if d
+        ))
+        count_of = dict(zip([d for d in pack_dirs if d], counts))
+        for row, pack_dir in zip(packaged, pack_dirs):
             file_count = ""
-            if pack_dir and Path(pack_dir).exists():
-                file_count = str(len(list(Path(pack_dir).iterdir())))
+            if count_of.get(pack_dir) is not None:
+                file_count = str(count_of[pack_dir])
 
             folder_name = Path(pack_dir).name if pack_dir else "N/A"
             table.add_row(
@@ -76,15 +85,11 @@ async def main():
         console.print(table)
 
     # Show pipeline summary
-    all_statuses = db.execute("""
-        SELECT status, COUNT(*) as cnt FROM clips GROUP BY status ORDER BY status
-    """).fetchall()
-
     rprint("\n[bold]Full Pipeline Status:[/bold]")
-    for s in all_statuses:
+    for status, cnt in pipeline_counts(db, PROFILE_SLUG).items():
         emoji = {"DISCOVERED": "🔍", "DOWNLOADED": "⬇️", "TRANSCRIBED": "📝",
-                 "DECIDED": "🧠", "RENDERED": "🎬", "PACKAGED": "📦", "FAILED": "❌"}.get(s["status"], "?")
-        rprint(f"  {emoji} {s['status']}: {s['cnt']}")
+                 "DECIDED": "🧠", "RENDERED": "🎬", "PACKAGED": "📦", "FAILED": "❌"}.get(status, "?")
+        rprint(f"  {emoji} {status}: {cnt}")
 
     db.close()
 
@@ -1,44 +1,275 @@
-"""Transcribe clips using faster-whisper + apply quality gates."""
+"""Transcribe clips using faster-whisper (or whisper.cpp on Apple Silicon) + apply quality gates."""
 import asyncio
+import functools
 import json
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import threading
+from collections.abc import Iterator
 from pathlib import Path
-from src.db.database import get_db
-from src.models.schemas import ClipMeta, ClipStatus, ProfileRules
+from src.db.database import shared_db
+from src.models.schemas import ClipStatus, ProfileRules
 from src.config import settings
 from src.utils.log import log
 
+try:
+    import orjson  # several times faster than json.dumps on word-level transcripts
+except ImportError:
+    orjson = None
+
 # Lazy-load whisper model (heavy import)
 _model = None
+_backend = None  # "faster-whisper" | "whispercpp", set by _get_model
+_model_lock = threading.Lock()
+_infer_lock = threading.Lock()
+
+# Whisper's native input: 16 kHz mono
+SAMPLE_RATE = 16000
+
+# A pause this long starts a new segment (same as the faster-whisper VAD setting)
+SEGMENT_GAP_SEC = 0.5
+
+
+def _want_whispercpp() -> bool:
+    if settings.whisper_backend == "whispercpp":
+        return True
+    # faster-whisper (CTranslate2) has no Metal/ANE path; whisper.cpp does
+    return settings.whisper_backend == "auto" and (platform.system(), platform.machine()) == ("Darwin", "arm64")
+
+
+def transcribe_workers() -> int:
+    """
+    Clips transcribed at once. On CPU two overlap one clip's ffmpeg decode and
+    DB/JSON work with the other's inference; Metal runs one inference at a time.
+    """
+    if settings.transcribe_concurrency > 0:
+        return settings.transcribe_concurrency
+    return 1 if _want_whispercpp() else 2
+
+
+def _ensure_coreml_encoder(models_dir: Path) -> bool:
+    """
+    Make sure the CoreML encoder sits next to the ggml model. whisper.cpp
+    builds with WHISPER_COREML=1 load it automatically and run the encoder on
+    the ANE; it is named after the model without its quantization suffix.
+    """
+    name = settings.whispercpp_model.split("-")[0]
+    encoder = models_dir / f"ggml-{name}-encoder.mlmodelc"
+    if encoder.exists() or not settings.whispercpp_src:
+        return encoder.exists()
+
+    src = Path(settings.whispercpp_src).expanduser()
+    log.info(f"Generating CoreML encoder for {name} (one-time)...")
+    try:
+        subprocess.run(
+            ["bash", "models/generate-coreml-model.sh", name],
+            cwd=src, check=True, capture_output=True,
+        )
+        shutil.move(str(src / "models" / encoder.name), encoder)
+    except (OSError, subprocess.CalledProcessError) as e:
+        log.warning(f"CoreML encoder generation failed, encoder stays on Metal/CPU: {e}")
+        return False
+    return True
+
+
+def _int8_model(name: str) -> str:
+    """
+    CTranslate2 int8 conversion of the size name's Transformers checkpoint,
+    made once and kept under whisper_models_dir, so loading doesn't
+    re-quantize the float16 hub weights every start. Falls back to the hub
+    model when the converter (ctranslate2 + transformers[torch]) isn't
+    available; repo ids and local dirs are loaded as given.
+    """
+    if "/" in name or Path(name).exists():
+        return name
+    repo = f"distil-whisper/{name}" if name.startswith("distil-") else f"openai/whisper-{name}"
+    out = Path(settings.whisper_models_dir).expanduser() / f"whisper-{name}-int8"
+    if (out / "model.bin").exists():
+        return str(out)
+    if shutil.which("ct2-transformers-converter") is None:
+        return name
+
+    log.info(f"Converting {repo} to int8 (one-time)...")
+    try:
+        subprocess.run(
+            ["ct2-transformers-converter", "--model", repo,
+             "--output_dir", str(out), "--quantization", "int8",
+             "--copy_files", "tokenizer.json", "preprocessor_config.json"],
+            check=True, capture_output=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        log.warning(f"int8 conversion failed, loading the hub model: {e}")
+        shutil.rmtree(out, ignore_errors=True)
+        return name
+    return str(out)
 
 
 def _get_model():
-    """Lazy-load faster-whisper model."""
-    global _model
-    if _model is None:
+    """Lazy-load the whisper model for the configured backend."""
+    global _model, _backend
+    with _model_lock:  # concurrent first calls load it once
+        if _model is not None:
+            return _model
+
+        if _want_whispercpp():
+            try:
+                from pywhispercpp.model import Model
+            except ImportError:
+                log.info("pywhispercpp not installed — using faster-whisper")
+            else:
+                models_dir = Path(settings.whisper_models_dir).expanduser()
+                models_dir.mkdir(parents=True, exist_ok=True)
+                ane = _ensure_coreml_encoder(models_dir)
+                log.info(f"Loading whisper.cpp model ({settings.whispercpp_model}, "
+                         f"encoder on {'ANE' if ane else 'Metal'})...")
+                _model = Model(settings.whispercpp_model, models_dir=str(models_dir),
+                               n_threads=os.cpu_count() or 4)
+                _backend = "whispercpp"
+                log.info("Whisper model loaded")
+                return _model
+
         from faster_whisper import WhisperModel
-        log.info("Loading whisper model...")
+        workers = transcribe_workers()
+        log.info(f"Loading whisper model ({settings.whisper_model})...")
+        # num_workers lets that many transcribe() calls run in parallel from
+        # threads; the cores are split between them
         _model = WhisperModel(
-            "medium.en",
+            _int8_model(settings.whisper_model),
             device="cpu",
             compute_type="int8",
+            cpu_threads=max(1, (os.cpu_count() or 4) // workers),
+            num_workers=workers,
         )
+        _backend = "faster-whisper"
         log.info("Whisper model loaded")
-    return _model
+        return _model
 
 
-def transcribe_audio(audio_path: str) -> dict:
+def warm_up() -> None:
     """
-    Transcribe an audio/video file with WORD-LEVEL timestamps.
-    Returns {
-        segments: [{start, end, text, words: [{start, end, word}...]}...],
-        words: [{start, end, word}...],  # flat list of all words
-        language, duration, full_text
+    Load the model (and faster-whisper's VAD) ahead of the first clip, e.g. on
+    a thread while downloads run. Failures are left for transcribe_clip to report.
+    """
+    try:
+        _get_model()
+        if _backend == "faster-whisper":
+            import faster_whisper.vad  # noqa: F401
+    except Exception as e:
+        log.warning(f"Whisper warm-up failed: {e}")
+
+
+# Decoded samples are kept beside the source for the diarizer (render stage)
+PCM_CACHE_SUFFIX = ".pcm16k.npy"
+
+
+def pcm_cache_enabled() -> bool:
+    """The cache only has a reader when diarization can run, i.e. with an HF token."""
+    return bool(settings.hf_token)
+
+
+def cached_pcm(source_path: str):
+    """
+    16 kHz mono float32 samples saved by an earlier _decode_pcm, or None when
+    there is no cache or the source has been replaced since it was written.
+    """
+    cache = Path(source_path).with_suffix(PCM_CACHE_SUFFIX)
+    try:
+        if cache.stat().st_mtime_ns < os.stat(source_path).st_mtime_ns:
+            return None
+    except OSError:
+        return None
+    import numpy as np
+    return np.load(cache)
+
+
+def _decode_pcm(audio_path: str):
+    """Decode an audio/video file's first audio track to 16 kHz mono float32 (numpy)."""
+    import numpy as np
+    use_cache = pcm_cache_enabled()
+    if use_cache:
+        pcm = cached_pcm(audio_path)
+        if pcm is not None:
+            return pcm
+
+    proc = subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-i", audio_path,
+         "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "f32le", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True,
+    )
+    pcm = np.frombuffer(proc.stdout, dtype=np.float32)
+
+    if use_cache:
+        try:
+            np.save(Path(audio_path).with_suffix(PCM_CACHE_SUFFIX), pcm)
+        except OSError as e:
+            log.warning(f"Could not cache decoded audio: {e}")
+    return pcm
+
+
+def _transcribe_whispercpp(model, pcm) -> dict:
+    """
+    whisper.cpp path: one whisper segment per word (max_len=1 + token
+    timestamps), regrouped into sentence-level segments so the result has the
+    same shape as the faster-whisper one.
+    """
+    with _infer_lock:  # one whisper.cpp context, not safe to share across threads
+        pieces = model.transcribe(
+            pcm,
+            language="en",
+            token_timestamps=True,
+            max_len=1,
+            split_on_word=True,
+        )
+
+    # t0/t1 are in 10 ms ticks
+    all_words = []
+    for p in pieces:
+        word = p.text.strip()
+        if word:
+            all_words.append({"start": round(p.t0 / 100, 3), "end": round(p.t1 / 100, 3), "word": word})
+
+    segments = []
+    for w in all_words:
+        prev = segments[-1]["words"][-1] if segments else None
+        if prev is None or prev["word"][-1] in ".?!" or w["start"] - prev["end"] >= SEGMENT_GAP_SEC:
+            segments.append({"start": w["start"], "end": w["end"], "text": "", "words": []})
+        seg = segments[-1]
+        seg["words"].append(w)
+        seg["end"] = w["end"]
+    for seg in segments:
+        seg["text"] = " ".join(w["word"] for w in seg["words"])
+
+    return {
+        "segments": segments,
+        "words": all_words,
+        "language": "en",
+        "language_probability": 1.0,  # language is forced, as with faster-whisper
+        "duration": round(len(pcm) / SAMPLE_RATE, 3),
+        "full_text": " ".join(seg["text"] for seg in segments),
     }
+
+
+def transcribe_stream(audio) -> tuple[Iterator[dict], dict]:
+    """
+    Transcribe an audio/video file path, or samples from _decode_pcm, with
+    WORD-LEVEL timestamps, lazily.
+    Returns (segments, info): segments yields {start, end, text, words: [{start, end, word}...]}
+    as whisper decodes them — closing it stops decoding; info is {language,
+    language_probability, duration}, known before the first segment.
     """
     model = _get_model()
+    if _backend == "whispercpp":
+        pcm = _decode_pcm(audio) if isinstance(audio, str) else audio
+        transcript = _transcribe_whispercpp(model, pcm)
+        info = {k: transcript[k] for k in ("language", "language_probability", "duration")}
+        # A generator like the faster-whisper path, so callers can close() it
+        return (seg for seg in transcript["segments"]), info
 
     segments_raw, info = model.transcribe(
-        audio_path,
+        audio,
         beam_size=5,
         language="en",
         vad_filter=True,
@@ -46,42 +277,125 @@ def transcribe_audio(audio_path: str) -> dict:
             min_silence_duration_ms=500,
         ),
         word_timestamps=True,  # KEY: enables per-word timing
+        # Clips are short; not feeding back earlier text also avoids repetition
+        # loops and is what distil-whisper models expect
+        condition_on_previous_text=False,
     )
 
-    segments = []
-    all_words = []
-    full_text_parts = []
-
-    for seg in segments_raw:
-        seg_words = []
-        if seg.words:
-            for w in seg.words:
-                word_entry = {
-                    "start": round(w.start, 3),
-                    "end": round(w.end, 3),
-                    "word": w.word.strip(),
+    def _segments():
+        try:
+            for seg in segments_raw:
+                yield {
+                    "start": round(seg.start, 3),
+                    "end": round(seg.end, 3),
+                    "text": seg.text.strip(),
+                    "words": [
+                        {"start": round(w.start, 3), "end": round(w.end, 3), "word": w.word.strip()}
+                        for w in seg.words or ()
+                    ],
                 }
-                seg_words.append(word_entry)
-                all_words.append(word_entry)
+        finally:
+            segments_raw.close()
 
-        segments.append({
-            "start": round(seg.start, 3),
-            "end": round(seg.end, 3),
-            "text": seg.text.strip(),
-            "words": seg_words,
-        })
-        full_text_parts.append(seg.text.strip())
-
-    return {
-        "segments": segments,
-        "words": all_words,
+    return _segments(), {
         "language": info.language,
         "language_probability": round(info.language_probability, 3),
         "duration": round(info.duration, 3),
-        "full_text": " ".join(full_text_parts),
     }
 
 
+def _dumps(obj) -> str:
+    """Compact JSON, through orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _assemble(segments: list[dict], info: dict) -> dict:
+    return {
+        "segments": segments,
+        "words": [w for seg in segments for w in seg["words"]],  # flat list of all words
+        **info,
+        "speech_duration": round(sum(seg["end"] - seg["start"] for seg in segments), 3),
+        "full_text": " ".join(seg["text"] for seg in segments),
+    }
+
+
+def transcribe_audio(audio_path: str) -> dict:
+    """
+    Transcribe an audio/video file with WORD-LEVEL timestamps.
+    Returns {
+        segments: [{start, end, text, words: [{start, end, word}...]}...],
+        words: [{start, end, word}...],  # flat list of all words
+        language, duration, speech_duration, full_text
+    }
+    """
+    segments, info = transcribe_stream(audio_path)
+    return _assemble(list(segments), info)
+
+
+def _preflight_silence(pcm, rules: ProfileRules) -> tuple[bool, str]:
+    """
+    Silence gate on the raw audio, before whisper is loaded or run: Silero VAD
+    (the one faster-whisper bundles, same 500 ms setting) gives the speech
+    time. Skipped when faster-whisper isn't installed.
+    """
+    try:
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+    except ImportError:
+        return True, ""
+
+    spans = get_speech_timestamps(pcm, VadOptions(min_silence_duration_ms=500))
+    return gate_silence({
+        "duration": len(pcm) / SAMPLE_RATE,
+        "speech_duration": sum(span["end"] - span["start"] for span in spans) / SAMPLE_RATE,
+        "segments": [],
+    }, rules)
+
+
+def transcribe_to_file(audio_path: str, transcript_path: Path, rules: ProfileRules) -> tuple[dict | None, str]:
+    """
+    Transcribe into transcript_path, writing segments as they are decoded.
+    The hook gate only needs the first segment, so a clip that fails it stops
+    whisper there; out-of-band or mostly-silent audio never reaches whisper at all.
+    Returns (transcript, "") or (None, fail_reason).
+    """
+    # Decoded once here, for the length/VAD preflight and whisper
+    pcm = _decode_pcm(audio_path)
+    passed, reason = gate_length({"duration": len(pcm) / SAMPLE_RATE}, rules)
+    if passed:
+        passed, reason = _preflight_silence(pcm, rules)
+    if not passed:
+        return None, reason
+
+    segments, info = transcribe_stream(pcm)
+    first = next(segments, None)
+    passed, reason = gate_hook({"segments": [first] if first else []}, rules)
+    if not passed:
+        segments.close()
+        return None, reason
+
+    # Streamed into a temp file and renamed once complete, so a whisper error
+    # or cancellation never leaves a truncated transcript.json behind
+    decoded = [first]
+    tmp_path = transcript_path.with_suffix(".json.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:  # orjson emits raw UTF-8
+            f.write('{"segments":[' + _dumps(first))
+            for seg in segments:
+                f.write("," + _dumps(seg))
+                decoded.append(seg)
+            transcript = _assemble(decoded, info)
+            rest = {k: v for k, v in transcript.items() if k != "segments"}
+            f.write("]," + _dumps(rest)[1:])
+        os.replace(tmp_path, transcript_path)
+    except BaseException:
+        segments.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return transcript, ""
+
+
 # ── Quality Gates ──
 
 def gate_hook(transcript: dict, rules: ProfileRules) -> tuple[bool, str]:
@@ -97,7 +411,9 @@ def gate_silence(transcript: dict, rules: ProfileRules) -> tuple[bool, str]:
     total_duration = transcript["duration"]
     if total_duration <= 0:
         return False, "zero_duration"
-    speech_duration = sum(seg["end"] - seg["start"] for seg in transcript["segments"])
+    speech_duration = transcript.get("speech_duration")
+    if speech_duration is None:  # transcripts written before it was stored
+        speech_duration = sum(seg["end"] - seg["start"] for seg in transcript["segments"])
     silence_ratio = 1.0 - (speech_duration / total_duration)
     if silence_ratio > rules.silence_ratio_max:
         return False, f"too_silent:{silence_ratio:.0%}>(max {rules.silence_ratio_max:.0%})"
@@ -107,6 +423,8 @@ def gate_silence(transcript: dict, rules: ProfileRules) -> tuple[bool, str]:
 def gate_length(transcript: dict, rules: ProfileRules) -> tuple[bool, str]:
     dur = transcript["duration"]
     min_len, max_len = rules.length_band_sec
+    if min_len <= dur <= max_len:
+        return True, ""
     if dur < min_len:
         return False, f"too_short:{dur:.0f}s<(min {min_len}s)"
     if dur > max_len:
@@ -116,7 +434,8 @@ def gate_length(transcript: dict, rules: ProfileRules) -> tuple[bool, str]:
 
 
 def run_quality_gates(transcript: dict, rules: ProfileRules) -> tuple[bool, str]:
-    gates = [("hook", gate_hook), ("silence", gate_silence), ("length", gate_length)]
+    # Cheapest first: length is one comparison on the duration
+    gates = [("length", gate_length), ("hook", gate_hook), ("silence", gate_silence)]
     for name, gate_fn in gates:
         passed, reason = gate_fn(transcript, rules)
         if not passed:
@@ -126,10 +445,62 @@ def run_quality_gates(transcript: dict, rules: ProfileRules) -> tuple[bool, str]
 
 # ── Orchestrator ──
 
-async def transcribe_clip(clip_row_id: int) -> bool:
-    db = get_db()
+@functools.lru_cache(maxsize=32)
+def _parse_rules(rules_json: str) -> ProfileRules:
+    """Every clip of a profile carries the same rules_json; validate it once."""
+    return ProfileRules.model_validate_json(rules_json)
+
+
+# (ok, clip id, new paths or None, fail reason or None)
+TranscribeResult = tuple[bool, int, dict | None, str | None]
+
+TRANSCRIBE_COMMIT_EVERY = 10
+
+_STMT_TRANSCRIBED = """
+    UPDATE clips SET status = ?, paths_json = ?, updated_at = datetime('now')
+    WHERE id = ?
+"""
+
+_STMT_FAIL = """
+    UPDATE clips SET status = ?, fail_reason = ?, paths_json = COALESCE(?, paths_json),
+                     updated_at = datetime('now')
+    WHERE id = ?
+"""
+
+
+def _write_transcribe_results(db: sqlite3.Connection, results: list[TranscribeResult]) -> None:
+    """Apply a batch of transcription outcomes in one transaction."""
+    passed = [
+        (ClipStatus.TRANSCRIBED.value, _dumps(new_paths), clip_row_id)
+        for ok, clip_row_id, new_paths, _ in results if ok
+    ]
+    failed = [
+        (ClipStatus.FAILED.value, reason, _dumps(new_paths) if new_paths else None, clip_row_id)
+        for ok, clip_row_id, new_paths, reason in results if not ok and reason
+    ]
+    with db:
+        if passed:
+            db.executemany(_STMT_TRANSCRIBED, passed)
+        if failed:
+            db.executemany(_STMT_FAIL, failed)
+
+
+async def transcribe_clip(clip_row_id: int, db: sqlite3.Connection | None = None) -> bool:
+    """
+    Transcribe one DOWNLOADED clip and record the outcome. Uses the shared
+    connection unless the caller passes one; it is never closed here.
+    """
+    if db is None:
+        db = shared_db()
+    result = await _transcribe_clip(db, clip_row_id)
+    _write_transcribe_results(db, [result])
+    return result[0]
+
+
+async def _transcribe_clip(db: sqlite3.Connection, clip_row_id: int) -> TranscribeResult:
     row = db.execute("""
-        SELECT cl.*, p.rules_json
+        SELECT cl.*, json_extract(cl.metadata_json, '$.title') as title,
+               json_extract(cl.metadata_json, '$.duration_sec') as listed_duration, p.rules_json
         FROM clips cl
         JOIN profiles p ON p.id = cl.profile_id
         WHERE cl.id = ? AND cl.status = ?
@@ -137,69 +508,55 @@ async def transcribe_clip(clip_row_id: int) -> bool:
 
     if not row:
         log.warning(f"Clip {clip_row_id} not found or not DOWNLOADED")
-        return False
+        return False, clip_row_id, None, None
 
     paths = json.loads(row["paths_json"])
     source_path = paths.get("source")
     if not source_path or not Path(source_path).exists():
         log.error(f"Source file missing for clip {clip_row_id}: {source_path}")
-        db.execute("""
-            UPDATE clips SET status = ?, fail_reason = 'source_missing', updated_at = datetime('now')
-            WHERE id = ?
-        """, (ClipStatus.FAILED.value, clip_row_id))
-        db.commit()
-        db.close()
-        return False
+        return False, clip_row_id, None, "source_missing"
+
+    rules = _parse_rules(row["rules_json"])
 
-    clip_meta = ClipMeta.model_validate_json(row["metadata_json"])
-    rules = ProfileRules.model_validate_json(row["rules_json"])
+    # The platform's listed length is enough for the length gate: out-of-band
+    # clips (e.g. whole VODs) fail without decoding or whisper
+    if row["listed_duration"]:
+        passed, fail_reason = gate_length({"duration": row["listed_duration"]}, rules)
+        if not passed:
+            log.warning(f"  ❌ Quality gate failed: {fail_reason} ({row['title']})")
+            return False, clip_row_id, None, fail_reason
 
-    log.info(f"Transcribing: {clip_meta.title} ({row['platform']}/{row['clip_id']})")
+    log.info(f"Transcribing: {row['title']} ({row['platform']}/{row['clip_id']})")
 
+    transcript_path = Path(source_path).parent / "transcript.json"
     loop = asyncio.get_event_loop()
     try:
-        transcript = await loop.run_in_executor(None, transcribe_audio, source_path)
+        transcript, fail_reason = await loop.run_in_executor(
+            None, transcribe_to_file, source_path, transcript_path, rules)
     except Exception as e:
         log.error(f"Transcription failed: {e}")
-        db.execute("""
-            UPDATE clips SET status = ?, fail_reason = ?, updated_at = datetime('now')
-            WHERE id = ?
-        """, (ClipStatus.FAILED.value, f"transcription_error:{e}", clip_row_id))
-        db.commit()
-        db.close()
-        return False
+        return False, clip_row_id, None, f"transcription_error:{e}"
 
-    transcript_path = Path(source_path).parent / "transcript.json"
-    with open(transcript_path, "w") as f:
-        json.dump(transcript, f, indent=2)
+    if transcript is None:
+        log.warning(f"  ❌ Quality gate failed: {fail_reason}")
+        return False, clip_row_id, None, fail_reason
 
     paths["transcript"] = str(transcript_path)
     passed, fail_reason = run_quality_gates(transcript, rules)
 
     if passed:
-        db.execute("""
-            UPDATE clips SET status = ?, paths_json = ?, updated_at = datetime('now')
-            WHERE id = ?
-        """, (ClipStatus.TRANSCRIBED.value, json.dumps(paths), clip_row_id))
-        db.commit()
-        db.close()
         word_count = len(transcript.get("words", []))
         log.info(f"  ✅ Transcribed ({len(transcript['segments'])} segments, {word_count} words, {transcript['duration']:.0f}s)")
         log.info(f"  Text: {transcript['full_text'][:100]}...")
-        return True
+        return True, clip_row_id, paths, None
     else:
-        db.execute("""
-            UPDATE clips SET status = ?, fail_reason = ?, paths_json = ?, updated_at = datetime('now')
-            WHERE id = ?
-        """, (ClipStatus.FAILED.value, fail_reason, json.dumps(paths), clip_row_id))
-        db.commit()
-        db.close()
         log.warning(f"  ❌ Quality gate failed: {fail_reason}")
-        return False
+        return False, clip_row_id, paths, fail_reason
 
 
 async def transcribe_downloaded_clips(profile_slug: str, limit: int = 10) -> dict:
-    db = get_db()
+    # One connection for the listing and every clip in the batch
+    db = shared_db()
     rows = db.execute("""
         SELECT cl.id FROM clips cl
         JOIN profiles p ON p.id = cl.profile_id
@@ -207,13 +564,24 @@ async def transcribe_downloaded_clips(profile_slug: str, limit: int = 10) -> dic
         ORDER BY cl.created_at ASC
         LIMIT ?
     """, (profile_slug, ClipStatus.DOWNLOADED.value, limit)).fetchall()
-    db.close()
-
-    stats = {"total": len(rows), "passed": 0, "failed": 0}
-    for row in rows:
-        ok = await transcribe_clip(row["id"])
-        if ok:
-            stats["passed"] += 1
-        else:
-            stats["failed"] += 1
-    return stats
\ No newline at end of file
+
+    sem = asyncio.Semaphore(transcribe_workers())
+
+    async def _bounded(clip_row_id: int) -> TranscribeResult:
+        async with sem:
+            return await _transcribe_clip(db, clip_row_id)
+
+    # Outcomes are written TRANSCRIBE_COMMIT_EVERY at a time with executemany
+    passed = 0
+    pending: list[TranscribeResult] = []
+    for fut in asyncio.as_completed([_bounded(row["id"]) for row in rows]):
+        result = await fut
+        passed += result[0]
+        pending.append(result)
+        if len(pending) >= TRANSCRIBE_COMMIT_EVERY:
+            _write_transcribe_results(db, pending)
+            pending = []
+    if pending:
+        _write_transcribe_results(db, pending)
+
+    return {"total": len(rows), "passed": passed, "failed": len(rows) - passed}